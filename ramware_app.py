@@ -3,36 +3,109 @@
 # =====================
 import sys
 import os
+import io
 import math
 import json
 import sqlite3
-import pandas as pd
+import time
+import threading
+from functools import lru_cache
 import numpy as np
-import plotly.graph_objects as go
 from datetime import datetime
-from PySide6.QtCore import Qt, QSize, QTranslator, QLocale, QDateTime, QTimer
-from PySide6.QtGui import (QIcon, QAction, QColor, QPixmap, QPalette, QFont, 
+from PySide6.QtCore import (Qt, QSize, QRectF, QTranslator, QLocale, QDateTime, QTimer, QThreadPool,
+                            QAbstractTableModel, QModelIndex, QEvent, Signal)
+from PySide6.QtGui import (QIcon, QAction, QColor, QPixmap, QImage, QPalette, QFont, 
                           QLinearGradient, QBrush, QPainter, QPen)
 from PySide6.QtWidgets import (QApplication, QMainWindow, QStackedWidget, QWidget, 
                               QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
-                              QLineEdit, QComboBox, QTableWidget, QTableWidgetItem,
+                              QLineEdit, QComboBox, QTableView,
                               QHeaderView, QFileDialog, QFormLayout, QDoubleSpinBox, 
                               QDateEdit, QGroupBox, QTabWidget, QMessageBox, 
                               QToolBar, QStatusBar, QSplitter, QFrame, QSizePolicy,
                               QSpacerItem, QScrollArea, QAbstractItemView, QStyleFactory,
                               QInputDialog)  # Added QInputDialog here
-from PySide6.QtWebEngineWidgets import QWebEngineView
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Image, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib import colors
-from reportlab.lib.units import inch
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
-import tempfile
+
+# Numba is optional: without it the calculation kernels run as plain Python.
+# Compiled kernels are cached per user, which also works for frozen builds
+# where there is no writable __pycache__ next to the sources.
+os.environ.setdefault("NUMBA_CACHE_DIR", os.path.join(os.path.expanduser("~"), "RamWare", "numba_cache"))
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# orjson is optional: a faster drop-in for the project metadata JSON
+try:
+    import orjson
+
+    def json_dumps(obj):
+        """Serialize to a JSON string with orjson"""
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+
+    def json_loads(text):
+        """Parse JSON with orjson, falling back for NaN/Infinity written by json"""
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return json.loads(text)
+except ImportError:
+    json_dumps = json.dumps
+    json_loads = json.loads
+
+# matplotlib is imported on first plot; it is slow to import and most
+# sessions never open the plots page
+@lru_cache(maxsize=None)
+def matplotlib_classes():
+    """Return (Figure, FigureCanvas), importing matplotlib on first use"""
+    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+    from matplotlib.figure import Figure
+    return Figure, FigureCanvas
+
+@lru_cache(maxsize=None)
+def pdf_styles():
+    """Return (sample styles, title style, well table style, summary table style)
+    
+    ReportLab is only needed for exports, so it is imported and the styles
+    are built on the first report; later reports reuse them.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+    
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'Title',
+        parent=styles['Title'],
+        fontSize=18,
+        spaceAfter=12,
+        alignment=1  # Center aligned
+    )
+    well_table_style = TableStyle([
+        ('FONT', (0, 0), (-1, -1), 'Helvetica', 10),
+        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ])
+    summary_table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#2c3e50")),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONT', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor("#f8f8f8")),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ])
+    return styles, title_style, well_table_style, summary_table_style
 
 # =====================
 # CONSTANTS & SETTINGS
@@ -42,231 +115,863 @@ VERSION = "1.0.0"
 AUTHOR = "Eng. Rami Maamoun"
 COMPANY = "RamWare Engineering"
 SUPPORT_EMAIL = "support@ramware.com"
+AUTOSAVE_DELAY_MS = 1500  # Idle time before edits are written to the database
+
+# UI colors and styles, parsed once at import instead of in every setup_ui
+GRADIENT_GREEN = (QColor("#2ecc71"), QColor("#27ae60"))
+GRADIENT_BLUE = (QColor("#3498db"), QColor("#2980b9"))
+GRADIENT_PURPLE = (QColor("#9b59b6"), QColor("#8e44ad"))
+GRADIENT_ORANGE = (QColor("#f39c12"), QColor("#d35400"))
+GRADIENT_RED = (QColor("#e74c3c"), QColor("#c0392b"))
+GRADIENT_GREY = (QColor("#95a5a6"), QColor("#7f8c8d"))
+BUTTON_TEXT_COLOR = QColor("#ffffff")
+AVERAGE_ROW_COLOR = QColor(67, 32, 136)
+
+PAGE_TITLE_STYLE = "font-size: 18px; font-weight: bold;"
+TABLE_STYLE = """
+    QTableView {
+        gridline-color: #d0d0d0;
+        alternate-background-color: #171515;
+    }
+    QHeaderView::section {
+        background-color: #2c3e50;
+        color: white;
+        padding: 4px;
+        border: 1px solid #1a2a3a;
+    }
+"""
+
+# Initial Time column of the data entry grid: 6 hours in 30 min intervals
+TIME_LABELS = tuple(f"{i // 2:02d}:{30 * (i % 2):02d}" for i in range(12))
+
+# Data entry columns shared by every test type
+DATA_COLUMNS_BASE = ("Time", "Choke", "WHP (PSIG)", "WHT (°C)", "Casing (PSIG)",
+                     "SEP P (PSIG)", "GAS T (°C)", "Oil Outlet P (PSIG)", "Oil T (°C)")
+
+# Results table (column, result key, number format) after the Time column
+RESULT_FIELDS_BASE = (("Q Oil (BBL/D)", "Q Oil", ".2f"), ("Q Water (BBL/D)", "Q Water", ".2f"),
+                      ("Total Q (BBL/D)", "Total Q", ".2f"))
+RESULT_FIELDS_GAS_LIFT = (
+    ("Q Gas (MSCF/D)", "Q Gas", ".2f"), ("Formation Gas (MSCF/D)", "Formation Gas", ".2f"),
+    ("GOR1 (SCF/STB)", "GOR1", ".2f"), ("GOR1 Formation (SCF/STB)", "GOR1 Formation", ".1f"),
+    ("GOR2 (SCF/STB)", "GOR2", ".1f"), ("Total GOR Formation (SCF/STB)", "Total GOR Formation", ".1f"),
+    ("Total GOR (SCF/STB)", "Total GOR", ".1f"),
+)
+RESULT_FIELDS_NATURAL_FLOW = (
+    ("Q Gas (MSCF/D)", "Q Gas", ".2f"), ("GOR1 (SCF/STB)", "GOR1", ".1f"),
+    ("GOR2 (SCF/STB)", "GOR2", ".1f"), ("Total GOR (SCF/STB)", "Total GOR", ".1f"),
+)
+
+# PDF summary rows (label, average key, number format, units)
+PDF_SUMMARY_BASE = (
+    ("Q Oil", "Q Oil", ".2f", "BBL/D"), ("Q Water", "Q Water", ".2f", "BBL/D"),
+    ("Total Liquid", "Total Q", ".2f", "BBL/D"), ("Q Gas", "Q Gas", ".2f", "MSCF/D"),
+    ("GOR1", "GOR1", ".2f", "SCF/STB"),
+)
+PDF_SUMMARY_GAS_LIFT = (
+    ("Total GOR", "Total GOR", ".2f", "SCF/STB"), ("Q Gas Inj", "Q Gas Inj", ".2f", "MSCF/D"),
+    ("Formation Gas", "Formation Gas", ".2f", "MSCF/D"),
+    ("GOR1 Formation", "GOR1 Formation", ".1f", "SCF/STB"), ("GOR2", "GOR2", ".1f", "SCF/STB"),
+    ("Total GOR Formation", "Total GOR Formation", ".1f", "SCF/STB"),
+)
+PDF_SUMMARY_NATURAL_FLOW = (
+    ("GOR2", "GOR2", ".1f", "SCF/STB"), ("Total GOR", "Total GOR", ".1f", "SCF/STB"),
+)
 
 # =====================
 # CALCULATION ENGINE
 # =====================
+# Compiled scalar kernels. Explicit signatures make Numba compile them at
+# import (and reuse the on-disk cache afterwards) instead of on first use.
+# Invalid inputs are rejected up front and reported as NaN; the
+# WellTestCalculator wrappers map NaN back to their fallback values.
+# fastmath omits the nnan/ninf flags so those NaN checks stay meaningful.
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+_SIG_4 = "float64(float64, float64, float64, float64)"
+_SIG_5 = "float64(float64, float64, float64, float64, float64)"
+_SIG_7 = "float64(float64, float64, float64, float64, float64, float64, float64)"
+_SIG_8 = "float64(float64, float64, float64, float64, float64, float64, float64, float64)"
+
+# Papay equation terms 10**(k * Tpr) rewritten as exp(k * ln(10) * Tpr)
+_PAPAY_A = 0.9813 * math.log(10)
+_PAPAY_B = 0.8157 * math.log(10)
+
+
+@njit("float64(float64, float64)", cache=True, fastmath=_FASTMATH)
+def _vcf_sep_nb(sep_temp, oil_api_60f):
+    sep_temp = (sep_temp * 9 / 5) + 32  # Convert Celsius to Fahrenheit
+    delta_t = sep_temp - 60
+    alpha = 0.00034878 - (0.00000091 * oil_api_60f)
+    beta = 0.0000000025
+    return math.exp(-(alpha * delta_t + beta * (delta_t ** 2)))
+
+
+# Shrinkage factor C coefficient, indexed by [API band, low GOR/P override].
+# API band: 0 = API < 25, 1 = 25 <= API <= 35, 2 = API > 35.
+# Override: 0 = none, 1 = SEP P < 50, 2 = GOR2 < 100, 3 = both.
+_SF_C = np.array([
+    [0.00000035, 0.0000002, 0.0000001, 0.00000005],
+    [0.0000003, 0.0000002, 0.0000001, 0.00000005],
+    [0.00000025, 0.0000002, 0.0000001, 0.00000005],
+])
+
+
+@njit("float64(float64, float64, float64)", cache=True, fastmath=_FASTMATH)
+def _shrinkage_nb(gor2, sep_p, oil_api_60f):
+    band = (oil_api_60f > 35) * 2 + (25 <= oil_api_60f <= 35)
+    override = (gor2 < 100) * 2 + (sep_p < 50)
+    return 1 - (_SF_C[band, override] * gor2 * sep_p)
+
+
+# The GOR2 correlation kernels take separator pressure in psia and
+# temperature in °F; calculate_gor2 does the unit conversion once.
+@njit(_SIG_7, cache=True, fastmath=_FASTMATH)
+def _vb_nb(sg_gas, sep_p, oil_api_60f, sep_temp, c1, c2, c3):
+    if sep_p < 0 or sep_temp + 460 <= 0:
+        return math.nan
+    return sg_gas * c1 * (sep_p ** c2) * math.exp(c3 * oil_api_60f / (sep_temp + 460))
+
+
+@njit(_SIG_4, cache=True, fastmath=_FASTMATH)
+def _standings_nb(sg_gas, sep_p, oil_api_60f, sep_temp):
+    if sep_p < 0:
+        return math.nan
+    exponent = 0.0125 * oil_api_60f - 0.00091 * sep_temp
+    return sg_gas * ((sep_p * (10 ** exponent)) / 18.2) ** 1.204
+
+
+@njit(_SIG_4, cache=True, fastmath=_FASTMATH)
+def _katz_nb(sg_gas, sep_p, oil_api_60f, sep_temp):
+    if sep_p < 0:
+        return math.nan
+    exponent = 0.01245 * oil_api_60f - 0.00091 * sep_temp
+    return 0.224 * sg_gas * (sep_p ** 1.182) * (10 ** exponent)
+
+
+@njit(_SIG_5, cache=True, fastmath=_FASTMATH)
+def _fpv_nb(sg_gas, p, t, h2s, co2):
+    # Convert ppm to mole fractions
+    y_h2s = h2s / 1e6
+    y_co2 = co2 / 1e6
+    if y_h2s < 0 or y_co2 < 0:
+        return math.nan
+
+    # Pseudo-critical properties (Sutton's method)
+    tpc = 168 + (325 * sg_gas) - (12.5 * (sg_gas ** 2))
+    ppc = 677 + (15 * sg_gas) - (37.5 * (sg_gas ** 2))
+
+    # Wichert-Aziz correction
+    a = y_h2s + y_co2
+    epsilon = 120 * (a ** 0.9 - a ** 1.6) + 15 * (y_h2s ** 0.5 - y_h2s ** 4)
+    tpc_corr = tpc - epsilon
+    denominator = tpc + y_h2s * (1 - y_h2s) * epsilon
+    if tpc_corr == 0 or denominator == 0:
+        return math.nan
+    ppc_corr = (ppc * tpc_corr) / denominator
+    if ppc_corr == 0:
+        return math.nan
+
+    # Pseudo-reduced properties
+    tpr = (t + 460) / tpc_corr
+    ppr = p / ppc_corr
+
+    # Compressibility factor (Papay equation)
+    z = 1 - 3.52 * ppr * math.exp(-_PAPAY_A * tpr) + 0.274 * ppr * ppr * math.exp(-_PAPAY_B * tpr)
+    if z <= 0:
+        return math.nan
+
+    # Supercompressibility factor
+    return 1 / math.sqrt(z)
+
+
+@njit(_SIG_8, cache=True, fastmath=_FASTMATH)
+def _gas_flow_nb(hw, sep_p, gas_t, sg_gas, orifice_d, line_bore, h2s, co2):
+    if line_bore == 0 or sg_gas <= 0 or gas_t + 460 <= 0:
+        return math.nan
+
+    # 1. Basic orifice factor (Fb)
+    beta = orifice_d / line_bore
+    if beta < 0 or beta >= 1:
+        return math.nan
+    # Integer powers by repeated squaring; only beta**0.1 needs a pow
+    beta2 = beta * beta
+    beta4 = beta2 * beta2
+    beta8 = beta4 * beta4
+    beta21 = beta2 * beta ** 0.1
+    cd = 0.5959 + 0.0312 * beta21 - 0.1840 * beta8
+    fb = (338.17 * (orifice_d ** 2) * cd) / math.sqrt(1 - beta4)
+
+    # 2. Specific gravity factor (Fg)
+    fg = 1 / math.sqrt(sg_gas)
+
+    # 3. Absolute pressure
+    pf = sep_p + 14.7
+
+    # 4. Expansion factor (Y2)
+    delta_p_psi = hw * 0.03613
+    p1 = pf + delta_p_psi  # Upstream pressure
+    if p1 == 0 or hw * pf < 0:
+        return math.nan
+    y2 = 1 - ((0.41 + 0.35 * beta4) * delta_p_psi) / (1.28 * p1)
+
+    # 5. Flowing temperature factor (Ftf)
+    ftf = math.sqrt(520 / (gas_t + 460))
+
+    # 6. Supercompressibility factor (Fpv)
+    fpv = _fpv_nb(sg_gas, p1, gas_t, h2s, co2)
+    if math.isnan(fpv):
+        fpv = 1.0
+
+    # 7. Calculate gas flow
+    return (24 * fb * fg * y2 * ftf * fpv * math.sqrt(hw * pf)) / 1000
+
+
+# GOR2 method tags passed to the fused kernels
+GOR2_API = 0
+GOR2_VASQUEZ_BEGGS = 1
+GOR2_STANDINGS = 2
+GOR2_KATZ = 3
+GOR2_METHODS = {
+    'API': GOR2_API,
+    'VASQUEZ_BEGGS': GOR2_VASQUEZ_BEGGS,
+    'STANDINGS': GOR2_STANDINGS,
+    'KATZ': GOR2_KATZ,
+    # Names as shown in the parameters page combo box
+    'VASQUEZ BEGGS': GOR2_VASQUEZ_BEGGS,
+    "STANDING'S": GOR2_STANDINGS,
+}
+
+
+def gor2_method_tag(method):
+    """Resolve a GOR2 method name to its GOR2_* tag (-1 when unknown)"""
+    return GOR2_METHODS.get(method, -1)
+
+_ROW_OUTPUTS = ("oil_api_60f", "gor2", "sf", "vcf_sep", "q_gas", "q_oil", "q_water")
+_SIG_ROW_TAIL = "UniTuple(float64, 7)(" + ", ".join(["float64"] * 15 + ["int64"]) + ")"
+_SIG_ROW = "UniTuple(float64, 7)(" + ", ".join(["float64"] * 15 + ["int64"] * 2) + ")"
+
+
+@njit("float64(float64, float64)", cache=True, fastmath=_FASTMATH)
+def _api_60f_nb(oil_api, oil_temp_c):
+    oil_temp_f = (oil_temp_c * 9 / 5) + 32
+    if oil_temp_f <= 60:
+        return oil_api
+    return oil_api - (0.00035 * (oil_temp_f - 60) * (oil_api - 10))
+
+
+@njit(_SIG_ROW_TAIL, cache=True, fastmath=_FASTMATH)
+def _row_tail_nb(api_60f, gor2, sep_p_psig, sep_temp_c, gas_t, sg_gas, hw,
+                 orifice_d, line_bore, h2s, co2, vs_liquid_or_oil, vs_water,
+                 wio_or_bsw, meter_factor, mode):
+    """The rest of a well-test row once Oil API 60°F and GOR2 are known"""
+    vcf_sep = _vcf_sep_nb(sep_temp_c, api_60f)
+    if not math.isfinite(vcf_sep):
+        vcf_sep = 1.0
+    
+    if not math.isfinite(gor2):
+        gor2 = 0.0
+    
+    sf = _shrinkage_nb(gor2, sep_p_psig, api_60f)
+    
+    q_gas = _gas_flow_nb(hw, sep_p_psig, gas_t, sg_gas, orifice_d, line_bore, h2s, co2)
+    if not math.isfinite(q_gas):
+        q_gas = 0.0
+    
+    q_oil = vs_liquid_or_oil * (1 - wio_or_bsw) * meter_factor * sf * vcf_sep * 48
+    if mode == 1:
+        q_water = ((vs_water * meter_factor) + (vs_liquid_or_oil * wio_or_bsw)) * 48
+    else:
+        q_water = vs_liquid_or_oil * meter_factor * wio_or_bsw * 48
+    
+    return api_60f, gor2, sf, vcf_sep, q_gas, q_oil, q_water
+
+
+@njit(_SIG_ROW, cache=True, fastmath=_FASTMATH)
+def _compute_row_nb(oil_api, oil_temp_c, sep_p_psig, sep_temp_c, gas_t, sg_gas, hw,
+                    orifice_d, line_bore, h2s, co2, vs_liquid_or_oil, vs_water,
+                    wio_or_bsw, meter_factor, mode, gor_method):
+    """One well-test row, Oil API 60°F through flow rates, in one kernel
+    
+    mode is 1 for three-phase and 0 for two-phase separation (vs_water is
+    then ignored); gor_method is one of the GOR2_* tags.
+    """
+    # Unit conversions, done once per row
+    sep_temp_f = (sep_temp_c * 9 / 5) + 32
+    sep_p_psia = sep_p_psig + 14.7
+    api_60f = _api_60f_nb(oil_api, oil_temp_c)
+    
+    if gor_method == GOR2_API:
+        if api_60f > 35:
+            gor2 = _vb_nb(sg_gas, sep_p_psia, api_60f, sep_temp_f, 0.0178, 1.1870, 23.931)
+        elif 25 <= api_60f <= 35:
+            gor2 = _standings_nb(sg_gas, sep_p_psia, api_60f, sep_temp_f)
+        else:
+            gor2 = _katz_nb(sg_gas, sep_p_psia, api_60f, sep_temp_f)
+    elif gor_method == GOR2_VASQUEZ_BEGGS:
+        if api_60f <= 30:
+            gor2 = _vb_nb(sg_gas, sep_p_psia, api_60f, sep_temp_f, 0.0362, 1.0937, 25.724)
+        else:
+            gor2 = _vb_nb(sg_gas, sep_p_psia, api_60f, sep_temp_f, 0.0178, 1.1870, 23.931)
+    elif gor_method == GOR2_STANDINGS:
+        gor2 = _standings_nb(sg_gas, sep_p_psia, api_60f, sep_temp_f)
+    elif gor_method == GOR2_KATZ:
+        gor2 = _katz_nb(sg_gas, sep_p_psia, api_60f, sep_temp_f)
+    else:
+        gor2 = 0.0
+    
+    return _row_tail_nb(api_60f, gor2, sep_p_psig, sep_temp_c, gas_t, sg_gas, hw,
+                        orifice_d, line_bore, h2s, co2, vs_liquid_or_oil, vs_water,
+                        wio_or_bsw, meter_factor, mode)
+
+
+@njit(cache=True)
+def _store_row_nb(out, i, row):
+    for k in range(7):
+        out[k, i] = row[k]
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def _compute_rows_nb(gor_method, oil_api, oil_temp, sg_gas, orifice_d, line_bore,
+                     h2s, co2, meter_factor, mode,
+                     sep_p, sep_temp, gas_t, hw, vs_oil, vs_water, wio):
+    """Run _compute_row_nb over every row; returns a (7, n) array"""
+    n = sep_p.shape[0]
+    out = np.empty((7, n))
+    for i in range(n):
+        _store_row_nb(out, i, _compute_row_nb(
+            oil_api, oil_temp, sep_p[i], sep_temp[i], gas_t[i], sg_gas, hw[i],
+            orifice_d, line_bore, h2s, co2, vs_oil[i], vs_water[i], wio[i],
+            meter_factor, mode, gor_method))
+    return out
+
+
+# Row drivers specialized on a single GOR2 correlation. Oil API 60°F is a
+# project constant, so the correlation is known before the loop starts and
+# the per-row method/band branches disappear.
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def _rows_vasquez_beggs_nb(c1, c2, c3, oil_api, oil_temp, sg_gas, orifice_d, line_bore,
+                           h2s, co2, meter_factor, mode,
+                           sep_p, sep_temp, gas_t, hw, vs_oil, vs_water, wio):
+    api_60f = _api_60f_nb(oil_api, oil_temp)
+    n = sep_p.shape[0]
+    out = np.empty((7, n))
+    for i in range(n):
+        gor2 = _vb_nb(sg_gas, sep_p[i] + 14.7, api_60f, (sep_temp[i] * 9 / 5) + 32, c1, c2, c3)
+        _store_row_nb(out, i, _row_tail_nb(
+            api_60f, gor2, sep_p[i], sep_temp[i], gas_t[i], sg_gas, hw[i],
+            orifice_d, line_bore, h2s, co2, vs_oil[i], vs_water[i], wio[i],
+            meter_factor, mode))
+    return out
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def _rows_standings_nb(oil_api, oil_temp, sg_gas, orifice_d, line_bore,
+                       h2s, co2, meter_factor, mode,
+                       sep_p, sep_temp, gas_t, hw, vs_oil, vs_water, wio):
+    api_60f = _api_60f_nb(oil_api, oil_temp)
+    n = sep_p.shape[0]
+    out = np.empty((7, n))
+    for i in range(n):
+        gor2 = _standings_nb(sg_gas, sep_p[i] + 14.7, api_60f, (sep_temp[i] * 9 / 5) + 32)
+        _store_row_nb(out, i, _row_tail_nb(
+            api_60f, gor2, sep_p[i], sep_temp[i], gas_t[i], sg_gas, hw[i],
+            orifice_d, line_bore, h2s, co2, vs_oil[i], vs_water[i], wio[i],
+            meter_factor, mode))
+    return out
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def _rows_katz_nb(oil_api, oil_temp, sg_gas, orifice_d, line_bore,
+                  h2s, co2, meter_factor, mode,
+                  sep_p, sep_temp, gas_t, hw, vs_oil, vs_water, wio):
+    api_60f = _api_60f_nb(oil_api, oil_temp)
+    n = sep_p.shape[0]
+    out = np.empty((7, n))
+    for i in range(n):
+        gor2 = _katz_nb(sg_gas, sep_p[i] + 14.7, api_60f, (sep_temp[i] * 9 / 5) + 32)
+        _store_row_nb(out, i, _row_tail_nb(
+            api_60f, gor2, sep_p[i], sep_temp[i], gas_t[i], sg_gas, hw[i],
+            orifice_d, line_bore, h2s, co2, vs_oil[i], vs_water[i], wio[i],
+            meter_factor, mode))
+    return out
+
+
+def _select_rows_kernel(gor_method, api_60f):
+    """Pick the row driver for a batch; returns (kernel, leading args)"""
+    if gor_method == GOR2_API:
+        if api_60f > 35:
+            return _rows_vasquez_beggs_nb, (0.0178, 1.1870, 23.931)
+        elif 25 <= api_60f <= 35:
+            return _rows_standings_nb, ()
+        return _rows_katz_nb, ()
+    elif gor_method == GOR2_VASQUEZ_BEGGS:
+        if api_60f <= 30:
+            return _rows_vasquez_beggs_nb, (0.0362, 1.0937, 25.724)
+        return _rows_vasquez_beggs_nb, (0.0178, 1.1870, 23.931)
+    elif gor_method == GOR2_STANDINGS:
+        return _rows_standings_nb, ()
+    elif gor_method == GOR2_KATZ:
+        return _rows_katz_nb, ()
+    # Unknown method: the generic driver reports GOR2 = 0
+    return _compute_rows_nb, (gor_method,)
+
+
+def _finite_or(value, fallback):
+    """Return value, or fallback when a kernel reported NaN/inf"""
+    return value if math.isfinite(value) else fallback
+
+
+def _finite_where(values, fallback):
+    """Array version of _finite_or"""
+    return np.where(np.isfinite(values), values, fallback)
+
+
+def _guarded_kernel(kernel, fallback):
+    """Wrap a scalar kernel so invalid or overflowing inputs return fallback"""
+    def call(*args):
+        try:
+            return _finite_or(kernel(*map(float, args)), fallback)
+        except (OverflowError, ZeroDivisionError):
+            # Without Numba the kernels run as plain Python, which raises
+            # where the compiled code returns inf
+            return fallback
+    
+    return call
+
+
+_vcf_sep_safe = _guarded_kernel(_vcf_sep_nb, 1.0)
+_shrinkage_safe = _guarded_kernel(_shrinkage_nb, 1.0)
+_vb_safe = _guarded_kernel(_vb_nb, 0.0)
+_standings_safe = _guarded_kernel(_standings_nb, 0.0)
+_katz_safe = _guarded_kernel(_katz_nb, 0.0)
+_fpv_safe = _guarded_kernel(_fpv_nb, 1.0)
+_gas_flow_safe = _guarded_kernel(_gas_flow_nb, 0.0)
+
+
 class WellTestCalculator:
     @staticmethod
     def calculate_oil_api_60f(oil_api, oil_temp):
-        """Calculate Oil API at 60°F"""
-        try:
-            oil_temp = (oil_temp * 9/5) + 32  # Convert Celsius to Fahrenheit)
-            
-            if oil_temp <= 60:
-                return oil_api
-            else:
-                delta_t = oil_temp - 60
-                return oil_api - (0.00035 * delta_t * (oil_api - 10))
-        except:
+        """Calculate Oil API at 60°F (element-wise for arrays)"""
+        oil_temp = (oil_temp * 9/5) + 32  # Convert Celsius to Fahrenheit)
+        
+        if isinstance(oil_temp, np.ndarray) or isinstance(oil_api, np.ndarray):
+            return np.where(oil_temp <= 60, oil_api, oil_api - (0.00035 * (oil_temp - 60) * (oil_api - 10)))
+        if oil_temp <= 60:
             return oil_api
+        else:
+            delta_t = oil_temp - 60
+            return oil_api - (0.00035 * delta_t * (oil_api - 10))
     
     @staticmethod
     def calculate_vcf_sep(sep_temp, oil_api_60f):
         """Volume Correction Factor for separator conditions"""
-        try:
-            sep_temp = (sep_temp * 9/5) + 32  # Convert Celsius to Fahrenheit)
-            delta_t = sep_temp - 60
-            alpha = 0.00034878 - (0.00000091 * oil_api_60f)
-            beta = 0.0000000025
-            return math.exp(-(alpha * delta_t + beta * (delta_t ** 2)))
-        except:
-            return 1.0
+        return _vcf_sep_safe(sep_temp, oil_api_60f)
     
     @staticmethod
     def calculate_shrinkage_factor(gor2, sep_p, oil_api_60f):
         """Calculate shrinkage factor with adjustments"""
-        try:
-            
-            # Base C value based on API
-            if oil_api_60f > 35:
-                c = 0.00000025
-            elif 25 <= oil_api_60f <= 35:
-                c = 0.0000003
-            else:  # oil_api_60f < 25
-                c = 0.00000035
-            
-            # Adjustments for low GOR or low separator pressure
-            if gor2 < 100 and sep_p < 50:
-                c = 0.00000005
-            elif gor2 < 100:
-                c = 0.0000001
-            elif sep_p < 50:
-                c = 0.0000002
-            
-            return 1 - (c * gor2 * sep_p)
-        except:
-            return 1.0
+        return _shrinkage_safe(gor2, sep_p, oil_api_60f)
     
     @staticmethod
     def calculate_gor2(oil_api_60f, sg_gas, sep_p, sep_temp, method='API'):
         """Calculate GOR2 based on selected method"""
-        try:
-            sep_p = sep_p + 14.7  # Convert to psia
-            sep_temp = (sep_temp * 9/5) + 32  # Convert Celsius to Fahrenheit)
-            if method == 'API':
-                # API-based correlation selection
-                if oil_api_60f > 35:
-                    return WellTestCalculator._vasquez_beggs(sg_gas, sep_p, oil_api_60f, sep_temp)
-                elif 25 <= oil_api_60f <= 35:
-                    return WellTestCalculator._standings(sg_gas, sep_p, oil_api_60f, sep_temp)
-                else:  # oil_api_60f < 25
-                    return WellTestCalculator._katz(sg_gas, sep_p, oil_api_60f, sep_temp)
-            
-            elif method == 'VASQUEZ_BEGGS':
-                # Vasquez-Beggs with API-dependent coefficients
-                sep_p = sep_p + 14.7  # Convert to psia
-                sep_temp = (sep_temp * 9/5) + 32  # Convert Celsius to Fahrenheit)
-                if oil_api_60f <= 30:
-                    return WellTestCalculator._vasquez_beggs(sg_gas, sep_p, oil_api_60f, sep_temp, 
-                                                            c1=0.0362, c2=1.0937, c3=25.724)
-                else:
-                    return WellTestCalculator._vasquez_beggs(sg_gas, sep_p, oil_api_60f, sep_temp, 
-                                                            c1=0.0178, c2=1.1870, c3=23.931)
-            
-            elif method == 'STANDINGS':
+        sep_p = sep_p + 14.7  # Convert to psia
+        sep_temp = (sep_temp * 9/5) + 32  # Convert Celsius to Fahrenheit)
+        tag = gor2_method_tag(method)
+        if tag == GOR2_API:
+            # API-based correlation selection
+            if oil_api_60f > 35:
+                return WellTestCalculator._vasquez_beggs(sg_gas, sep_p, oil_api_60f, sep_temp)
+            elif 25 <= oil_api_60f <= 35:
                 return WellTestCalculator._standings(sg_gas, sep_p, oil_api_60f, sep_temp)
-            
-            elif method == 'KATZ':
+            else:  # oil_api_60f < 25
                 return WellTestCalculator._katz(sg_gas, sep_p, oil_api_60f, sep_temp)
-            
+        
+        elif tag == GOR2_VASQUEZ_BEGGS:
+            # Vasquez-Beggs with API-dependent coefficients
+            if oil_api_60f <= 30:
+                return WellTestCalculator._vasquez_beggs(sg_gas, sep_p, oil_api_60f, sep_temp, 
+                                                        c1=0.0362, c2=1.0937, c3=25.724)
             else:
-                return 0.0
-        except:
+                return WellTestCalculator._vasquez_beggs(sg_gas, sep_p, oil_api_60f, sep_temp, 
+                                                        c1=0.0178, c2=1.1870, c3=23.931)
+        
+        elif tag == GOR2_STANDINGS:
+            return WellTestCalculator._standings(sg_gas, sep_p, oil_api_60f, sep_temp)
+        
+        elif tag == GOR2_KATZ:
+            return WellTestCalculator._katz(sg_gas, sep_p, oil_api_60f, sep_temp)
+        
+        else:
             return 0.0
     
     @staticmethod
     def _vasquez_beggs(sg_gas, sep_p, oil_api_60f, sep_temp, c1=0.0178, c2=1.1870, c3=23.931):
-        """Vasquez-Beggs correlation"""
-        try:
-            sep_p = sep_p + 14.7  # Convert to psia
-            sep_temp = (sep_temp * 9/5) + 32  # Convert Celsius to Fahrenheit)
-            return sg_gas * c1 * (sep_p ** c2) * math.exp(c3 * oil_api_60f / (sep_temp + 460))
-        except:
-            return 0.0
+        """Vasquez-Beggs correlation (sep_p in psia, sep_temp in °F)"""
+        return _vb_safe(sg_gas, sep_p, oil_api_60f, sep_temp, c1, c2, c3)
     
     @staticmethod
     def _standings(sg_gas, sep_p, oil_api_60f, sep_temp):
-        """Standing's correlation"""
-        try:
-            sep_p = sep_p + 14.7  # Convert to psia
-            exponent = 0.0125 * oil_api_60f - 0.00091 * sep_temp
-            return sg_gas * ((sep_p * (10 ** exponent)) / 18.2) ** 1.204
-        except:
-            return 0.0
+        """Standing's correlation (sep_p in psia, sep_temp in °F)"""
+        return _standings_safe(sg_gas, sep_p, oil_api_60f, sep_temp)
     
     @staticmethod
     def _katz(sg_gas, sep_p, oil_api_60f, sep_temp):
-        """Katz correlation"""
-        try:
-            sep_p = sep_p + 14.7  # Convert to psia
-            exponent = 0.01245 * oil_api_60f - 0.00091 * sep_temp
-            return 0.224 * sg_gas * (sep_p ** 1.182) * (10 ** exponent)
-        except:
-            return 0.0
+        """Katz correlation (sep_p in psia, sep_temp in °F)"""
+        return _katz_safe(sg_gas, sep_p, oil_api_60f, sep_temp)
     
     @staticmethod
     def calculate_gas_flow(hw, sep_p, gas_t, sg_gas, orifice_d, line_bore, h2s, co2):
         """Calculate gas flow rate using orifice equation"""
-        try:
-            # 1. Basic orifice factor (Fb)
-            beta = orifice_d / line_bore
-            cd = 0.5959 + 0.0312 * (beta ** 2.1) - 0.1840 * (beta ** 8)
-            fb = (338.17 * (orifice_d ** 2) * cd) / math.sqrt(1 - beta ** 4)
+        return _gas_flow_safe(hw, sep_p, gas_t, sg_gas, orifice_d, line_bore, h2s, co2)
+    
+    @staticmethod
+    def calculate_fpv(sg_gas, p, t, h2s, co2):
+        """Calculate supercompressibility factor with Wichert-Aziz correction"""
+        return _fpv_safe(sg_gas, p, t, h2s, co2)
+    
+    @staticmethod
+    def calculate_three_phase_flow(vs_oil, vs_water, wio, meter_factor, sf, vcf_sep):
+        """Calculate flow rates for three-phase separation"""
+        q_oil = vs_oil * (1 - wio) * meter_factor * sf * vcf_sep * 48
+        q_water = ((vs_water * meter_factor) + (vs_oil * wio)) * 48
+        return q_oil, q_water
+    
+    @staticmethod
+    def calculate_two_phase_flow(vs_liquid, bsw, meter_factor, sf, vcf_sep):
+        """Calculate flow rates for two-phase separation"""
+        q_oil = vs_liquid * (1 - bsw) * meter_factor * sf * vcf_sep * 48
+        q_water = vs_liquid * meter_factor * bsw * 48
+        return q_oil, q_water
+    
+    @staticmethod
+    def calculate_for_gas_lift(q_gas, q_gas_inj, q_oil, gor2):
+        """Calculate Gas Lift specific metrics (element-wise for arrays)"""
+        if isinstance(q_gas, np.ndarray) or isinstance(q_oil, np.ndarray):
+            formation_q_gas = np.maximum(q_gas - q_gas_inj, 0.0)
+            q_oil = np.asarray(q_oil, dtype=np.float64)
+            gor1_formation = np.zeros(np.broadcast(formation_q_gas, q_oil).shape)
+            np.divide(formation_q_gas * 1000, q_oil, out=gor1_formation, where=q_oil > 0)
+            return formation_q_gas, gor1_formation, gor1_formation + gor2
+        formation_q_gas = max(q_gas - q_gas_inj, 0)
+        if q_oil <= 0:
+            gor1_formation = 0
+        else:
+            gor1_formation = (formation_q_gas * 1000) / q_oil
+        total_gor_formation = gor1_formation + gor2
+        return formation_q_gas, gor1_formation, total_gor_formation
+    
+    @staticmethod
+    def calculate_batch(oil_api, oil_temp, sep_p, sep_temp, gas_t, sg_gas, hw,
+                        orifice_d, line_bore, h2s, co2, gor2_method='API'):
+        """Vectorized Oil API 60°F, VCF, GOR2, shrinkage and gas flow
+        
+        Every argument except gor2_method may be a scalar or an array; arrays
+        are broadcast against each other and the results are float64 arrays
+        matching the scalar methods element by element.
+        """
+        oil_api = np.asarray(oil_api, dtype=np.float64)
+        oil_temp = np.asarray(oil_temp, dtype=np.float64)
+        sep_p = np.asarray(sep_p, dtype=np.float64)
+        sep_temp = np.asarray(sep_temp, dtype=np.float64)
+        gas_t = np.asarray(gas_t, dtype=np.float64)
+        sg_gas = np.asarray(sg_gas, dtype=np.float64)
+        hw = np.asarray(hw, dtype=np.float64)
+        orifice_d = np.asarray(orifice_d, dtype=np.float64)
+        line_bore = np.asarray(line_bore, dtype=np.float64)
+        h2s = np.asarray(h2s, dtype=np.float64)
+        co2 = np.asarray(co2, dtype=np.float64)
+        
+        # Invalid rows come out as NaN/inf and are masked explicitly below
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            # Oil API at 60°F
+            oil_api_60f = WellTestCalculator.calculate_oil_api_60f(oil_api, oil_temp)
             
-            # 2. Specific gravity factor (Fg)
-            fg = 1 / math.sqrt(sg_gas)
+            # Volume correction factor
+            delta_t = ((sep_temp * 9/5) + 32) - 60
+            alpha = 0.00034878 - (0.00000091 * oil_api_60f)
+            vcf_sep = _finite_where(np.exp(-(alpha * delta_t + 0.0000000025 * (delta_t ** 2))), 1.0)
             
-            # 3. Absolute pressure
-            pf = sep_p + 14.7
+            # GOR2 (correlations in psia and °F)
+            p_psia = sep_p + 14.7
+            t_f = (sep_temp * 9/5) + 32
+            band = (oil_api_60f > 35).astype(np.intp) * 2 + ((oil_api_60f >= 25) & (oil_api_60f <= 35))
+            # Shape of the per-row outputs; band alone is 0-d for a scalar API
+            rows = np.broadcast(p_psia, t_f, oil_api_60f, sg_gas).shape
             
-            # 4. Expansion factor (Y2)
-            delta_p_psi = hw * 0.03613
-            p1 = pf + delta_p_psi  # Upstream pressure
-            y2 = 1 - ((0.41 + 0.35 * beta ** 4) * delta_p_psi) / (1.28 * p1)
+            def vasquez_beggs(c1=0.0178, c2=1.1870, c3=23.931):
+                return sg_gas * c1 * (p_psia ** c2) * np.exp(c3 * oil_api_60f / (t_f + 460))
             
-            # 5. Flowing temperature factor (Ftf)
-            ftf = math.sqrt(520 / (gas_t + 460))
+            def standings():
+                return sg_gas * ((p_psia * (10 ** (0.0125 * oil_api_60f - 0.00091 * t_f))) / 18.2) ** 1.204
             
-            # 6. Supercompressibility factor (Fpv)
-            fpv = WellTestCalculator.calculate_fpv(sg_gas, p1, gas_t, h2s, co2)
+            def katz():
+                return 0.224 * sg_gas * (p_psia ** 1.182) * (10 ** (0.01245 * oil_api_60f - 0.00091 * t_f))
             
-            # 7. Calculate gas flow
-            q_gas = (24 * fb * fg * y2 * ftf * fpv * math.sqrt(hw * pf)) / 1000
+            # The method is resolved once for the batch; only the correlations it
+            # can select are evaluated
+            method = gor2_method_tag(gor2_method)
+            if method == GOR2_API:
+                zeros = np.zeros(rows)
+                gor2 = np.choose(band, [
+                    correlation() if (band == i).any() else zeros
+                    for i, correlation in enumerate((katz, standings, vasquez_beggs))
+                ])
+            elif method == GOR2_VASQUEZ_BEGGS:
+                gor2 = np.where(
+                    oil_api_60f <= 30,
+                    vasquez_beggs(0.0362, 1.0937, 25.724),
+                    vasquez_beggs()
+                )
+            elif method == GOR2_STANDINGS:
+                gor2 = standings()
+            elif method == GOR2_KATZ:
+                gor2 = katz()
+            else:
+                gor2 = np.zeros(rows)
+            gor2 = _finite_where(gor2, 0.0)
             
-            return q_gas
-        except:
-            return 0.0
-    
-    @staticmethod
-    def calculate_fpv(sg_gas, p, t, h2s, co2):
-        """Calculate supercompressibility factor with Wichert-Aziz correction"""
-        try:
-            # Convert ppm to mole fractions
+            # Shrinkage factor, C gathered from the coefficient table
+            override = (gor2 < 100).astype(np.intp) * 2 + (sep_p < 50)
+            sf = 1 - (_SF_C[band, override] * gor2 * sep_p)
+            
+            # Gas flow (orifice equation)
+            beta = np.asarray(orifice_d / line_bore, dtype=np.float64)
+            beta2 = beta * beta
+            beta4 = beta2 * beta2
+            beta8 = beta4 * beta4
+            beta21 = beta2 * np.power(beta, 0.1)
+            cd = 0.5959 + 0.0312 * beta21 - 0.1840 * beta8
+            fb = (338.17 * (orifice_d ** 2) * cd) / np.sqrt(1 - beta4)
+            fg = 1 / np.sqrt(sg_gas)
+            pf = sep_p + 14.7
+            delta_p_psi = hw * 0.03613
+            p1 = pf + delta_p_psi
+            y2 = 1 - ((0.41 + 0.35 * beta4) * delta_p_psi) / (1.28 * p1)
+            ftf = np.sqrt(520 / (gas_t + 460))
+            
+            # Supercompressibility (Sutton + Wichert-Aziz + Papay)
             y_h2s = h2s / 1e6
             y_co2 = co2 / 1e6
-            
-            # Pseudo-critical properties (Sutton's method)
             tpc = 168 + (325 * sg_gas) - (12.5 * (sg_gas ** 2))
             ppc = 677 + (15 * sg_gas) - (37.5 * (sg_gas ** 2))
-            
-            # Wichert-Aziz correction
             a = y_h2s + y_co2
             epsilon = 120 * (a ** 0.9 - a ** 1.6) + 15 * (y_h2s ** 0.5 - y_h2s ** 4)
             tpc_corr = tpc - epsilon
             ppc_corr = (ppc * tpc_corr) / (tpc + y_h2s * (1 - y_h2s) * epsilon)
+            tpr = (gas_t + 460) / tpc_corr
+            ppr = p1 / ppc_corr
+            z = 1 - 3.52 * ppr * np.exp(-_PAPAY_A * tpr) + 0.274 * ppr * ppr * np.exp(-_PAPAY_B * tpr)
+            fpv = _finite_where(1 / np.sqrt(z), 1.0)
             
-            # Pseudo-reduced properties
-            tpr = (t + 460) / tpc_corr
-            ppr = p / ppc_corr
-            
-            # Compressibility factor (Papay equation)
-            z = 1 - (3.52 * ppr) / (10 ** (0.9813 * tpr)) + (0.274 * (ppr ** 2)) / (10 ** (0.8157 * tpr))
+            q_gas = _finite_where((24 * fb * fg * y2 * ftf * fpv * np.sqrt(hw * pf)) / 1000, 0.0)
             
-            # Supercompressibility factor
-            return 1 / math.sqrt(z)
-        except:
-            return 1.0
-    
-    @staticmethod
-    def calculate_three_phase_flow(vs_oil, vs_water, wio, meter_factor, sf, vcf_sep):
-        """Calculate flow rates for three-phase separation"""
-        try:
-            q_oil = vs_oil * (1 - wio) * meter_factor * sf * vcf_sep * 48
-            q_water = ((vs_water * meter_factor) + (vs_oil * wio)) * 48
-            return q_oil, q_water
-        except:
-            return 0.0, 0.0
+        return {
+            "oil_api_60f": oil_api_60f,
+            "vcf_sep": vcf_sep,
+            "gor2": gor2,
+            "sf": sf,
+            "q_gas": q_gas
+        }
     
     @staticmethod
-    def calculate_two_phase_flow(vs_liquid, bsw, meter_factor, sf, vcf_sep):
-        """Calculate flow rates for two-phase separation"""
-        try:
-            q_oil = vs_liquid * (1 - bsw) * meter_factor * sf * vcf_sep * 48
-            q_water = vs_liquid * meter_factor * bsw * 48
-            return q_oil, q_water
-        except:
-            return 0.0, 0.0
+    def calculate_rows(oil_api, oil_temp, sep_p, sep_temp, gas_t, sg_gas, hw,
+                       orifice_d, line_bore, h2s, co2, vs_oil, vs_water, wio,
+                       meter_factor, three_phase=True, gor2_method='API'):
+        """Evaluate the whole well-test chain, API 60°F to flow rates, per row
+        
+        sep_p, sep_temp, gas_t, hw, vs_oil, vs_water and wio are per-row
+        arrays; for two-phase tests vs_oil and wio hold the liquid volume and
+        BSW and vs_water is ignored. With Numba every row goes through one
+        fused kernel, otherwise the rows are evaluated with calculate_batch.
+        Returns a dict of float64 arrays.
+        """
+        if NUMBA_AVAILABLE:
+            kernel, leading = _select_rows_kernel(
+                gor2_method_tag(gor2_method), _api_60f_nb(float(oil_api), float(oil_temp))
+            )
+            out = kernel(
+                *leading, float(oil_api), float(oil_temp), float(sg_gas), float(orifice_d),
+                float(line_bore), float(h2s), float(co2), float(meter_factor),
+                1 if three_phase else 0,
+                *(np.ascontiguousarray(col, dtype=np.float64)
+                  for col in (sep_p, sep_temp, gas_t, hw, vs_oil, vs_water, wio))
+            )
+            return dict(zip(_ROW_OUTPUTS, out))
+        
+        batch = WellTestCalculator.calculate_batch(
+            oil_api, oil_temp, sep_p, sep_temp, gas_t, sg_gas, hw,
+            orifice_d, line_bore, h2s, co2, gor2_method
+        )
+        if three_phase:
+            q_oil, q_water = WellTestCalculator.calculate_three_phase_flow(
+                vs_oil, vs_water, wio, meter_factor, batch["sf"], batch["vcf_sep"]
+            )
+        else:
+            q_oil, q_water = WellTestCalculator.calculate_two_phase_flow(
+                vs_oil, wio, meter_factor, batch["sf"], batch["vcf_sep"]
+            )
+        batch["q_oil"] = q_oil
+        batch["q_water"] = q_water
+        return batch
     
     @staticmethod
-    def calculate_for_gas_lift(q_gas, q_gas_inj, q_oil, gor2):
-        """Calculate Gas Lift specific metrics"""
-        try:
-            formation_q_gas = max(q_gas - q_gas_inj, 0)
-            gor1_formation = (formation_q_gas * 1000) / q_oil if q_oil > 0 else 0
-            total_gor_formation = gor1_formation + gor2
-            return formation_q_gas, gor1_formation, total_gor_formation
-        except:
-            return 0.0, 0.0, 0.0
+    def calculate_time_series(params, time_series):
+        """Calculate the results of a time series for a project's parameters
+        
+        time_series maps the data entry headers to per-row lists. Returns
+        (results, columns): the per-row result records and the same values
+        as arrays ("Time" as a list), or ([], None) when there are no rows.
+        Only NumPy and the kernels are used, so this is safe on a worker thread.
+        """
+        row_count = len(next(iter(time_series.values()), ()))
+        if not row_count:
+            return [], None
+        
+        def column(key):
+            if key not in time_series:
+                return np.zeros(row_count)
+            return np.asarray(time_series[key], dtype=np.float64)
+        
+        # Volume differences between consecutive meter readings
+        three_phase = params["separation_type"] == "THREE PHASES"
+        if three_phase:
+            vs_oil = np.diff(column("Meter Oil (BBL)"), prepend=0.0)
+            vs_water = np.diff(column("Meter Water (BBL)"), prepend=0.0)
+            wio = column("WIO (%)") / 100.0
+        else:
+            vs_oil = np.diff(column("Meter Liquid (BBL)"), prepend=0.0)
+            vs_water = np.zeros_like(vs_oil)
+            wio = column("BSW (%)") / 100.0
+        
+        # Correlations and flow rates for the whole time series at once
+        rows = WellTestCalculator.calculate_rows(
+            params["oil_api"], params["oil_temp"],
+            column("SEP P (PSIG)"), column("Oil T (°C)"),  # Using oil temp as separator temp
+            column("GAS T (°C)"), params["sg_gas"], column("GAS DP (inH₂O)"),
+            params["orifice_diameter"], params["line_bore"],
+            params["h2s"], params["co2"], vs_oil, vs_water, wio,
+            params["meter_factor"], three_phase, params["gor2_method"]
+        )
+        gor2 = rows["gor2"]
+        q_gas = rows["q_gas"]
+        q_oil = rows["q_oil"]
+        q_water = rows["q_water"]
+        
+        # Calculate GORs; rows without oil keep GOR1 = 0
+        gor1 = np.zeros_like(q_oil)
+        np.divide(q_gas * 1000, q_oil, out=gor1, where=q_oil > 0)
+        
+        columns = {
+            "Time": time_series.get("Time", [""] * row_count),
+            "Q Oil": q_oil,
+            "Q Water": q_water,
+            "Total Q": q_oil + q_water,
+            "Q Gas": q_gas,
+            "GOR1": gor1,
+            "GOR2": gor2,
+            "Total GOR": gor1 + gor2
+        }
+        
+        # Gas Lift specific calculations
+        if params["production_type"] == "GAS LIFT":
+            q_gas_inj = column("Q Gas Inj (MSCF/D)")
+            formation_gas, gor1_formation, total_gor_formation = \
+                WellTestCalculator.calculate_for_gas_lift(q_gas, q_gas_inj, q_oil, gor2)
+            columns["Q Gas Inj"] = q_gas_inj
+            columns["Formation Gas"] = formation_gas
+            columns["GOR1 Formation"] = gor1_formation
+            columns["Total GOR Formation"] = total_gor_formation
+        
+        # One pass over the result columns to build the per-row records
+        keys = list(columns)
+        values = [col.tolist() if isinstance(col, np.ndarray) else col for col in columns.values()]
+        results = [dict(zip(keys, row)) for row in zip(*values)]
+        return results, columns
+
+
+def warmup_kernels():
+    """Compile (or load from the cache) the Numba kernels with dummy inputs"""
+    row = np.ones(1)
+    # One API per band so every specialized row driver gets compiled
+    for oil_api in (20.0, 30.0, 40.0):
+        for three_phase in (True, False):
+            WellTestCalculator.calculate_rows(
+                oil_api, 15.6, row, row, row, 0.7, row, 1.0, 4.0, 0.0, 0.0,
+                row, row, row * 0.1, 1.0, three_phase, 'API'
+            )
+
 
 # =====================
 # DATABASE MANAGER
 # =====================
 class DatabaseManager:
+    # Per-row tables of a project, stored column-wise in the rows BLOB
+    TABLE_KEYS = ("time_series", "results")
+    # Tables kept in memory as {column: list}; older projects stored them
+    # as a list of row dicts and are converted on load
+    COLUMNAR_KEYS = ("time_series",)
+    
+    # WAL journaling needs only one fsync per checkpoint instead of one per
+    # commit; synchronous=NORMAL is safe in WAL mode
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+    )
+    
+    # SQL text for the hot queries. sqlite3 caches the compiled statement per
+    # connection keyed on the exact text, so every call reuses one plan.
+    _stmts = {
+        'save_new': '''
+            INSERT INTO projects (name, data, rows)
+            VALUES (?, ?, ?)
+        ''',
+        'save_upd': '''
+            UPDATE projects 
+            SET name = ?, data = ?, rows = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        ''',
+        'load': '''
+            SELECT id, name, created_at, updated_at, data, rows
+            FROM projects
+            WHERE id = ?
+        ''',
+        'list': '''
+            SELECT id, name, created_at, updated_at
+            FROM projects
+            ORDER BY updated_at DESC
+            LIMIT ? OFFSET ?
+        ''',
+        'list_search': '''
+            SELECT id, name, created_at, updated_at
+            FROM projects
+            WHERE name LIKE ? ESCAPE '\\'
+            ORDER BY updated_at DESC
+            LIMIT ? OFFSET ?
+        ''',
+        'settings_get': 'SELECT language, theme, unit_system, last_project FROM settings WHERE id = 1',
+    }
+    
+    # Seconds a project list page is served from memory. Saves through this
+    # manager drop the cache at once; the TTL covers other writers.
+    LIST_CACHE_TTL = 5.0
+    
+    # Settings columns and the values save_settings falls back to
+    SETTINGS_DEFAULTS = {
+        'language': 'en',
+        'theme': 'dark',
+        'unit_system': 'imperial',
+        'last_project': None,
+    }
+    
     def __init__(self):
         self.db_path = os.path.join(os.path.expanduser("~"), "RamWare", "ramware.db")
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         self.conn = None
+        self._settings = None  # Last settings read from or written to the table
+        self._list_cache = {}  # (limit, offset, search) -> (monotonic time, rows)
         self.connect()
         self.create_tables()
     
@@ -274,6 +979,8 @@ class DatabaseManager:
         """Connect to SQLite database"""
         try:
             self.conn = sqlite3.connect(self.db_path)
+            for pragma in self.PRAGMAS:
+                self.conn.execute(pragma)
             return True
         except sqlite3.Error as e:
             print(f"Database connection error: {str(e)}")
@@ -291,10 +998,22 @@ class DatabaseManager:
                     name TEXT NOT NULL,
                     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    data TEXT
+                    data TEXT,
+                    rows BLOB
                 )
             ''')
             
+            # Databases created before the rows column existed
+            cursor.execute("PRAGMA table_info(projects)")
+            if "rows" not in [column[1] for column in cursor.fetchall()]:
+                cursor.execute("ALTER TABLE projects ADD COLUMN rows BLOB")
+            
+            # Project lists are ordered by last update
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_projects_updated
+                ON projects(updated_at DESC)
+            ''')
+            
             # User settings table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS settings (
@@ -318,28 +1037,38 @@ class DatabaseManager:
             print(f"Error creating tables: {str(e)}")
             return False
     
-    def save_project(self, project_data):
-        """Save project to database"""
+    def save_project(self, project_data, settings=None):
+        """Save project to database
+        
+        With settings, last_project is pointed at the project and the
+        settings are written in the same transaction, so one commit covers
+        both.
+        """
         try:
-            cursor = self.conn.cursor()
-            data_json = json.dumps(project_data)
+            metadata, rows_blob = self._pack_tables(project_data)
+            data_json = json_dumps(metadata)
             
-            if 'id' in project_data and project_data['id']:
-                # Update existing project
-                cursor.execute('''
-                    UPDATE projects 
-                    SET name = ?, data = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                ''', (project_data['name'], data_json, project_data['id']))
-            else:
-                # Insert new project
-                cursor.execute('''
-                    INSERT INTO projects (name, data)
-                    VALUES (?, ?)
-                ''', (project_data['name'], data_json))
-                project_data['id'] = cursor.lastrowid
+            with self.conn:
+                cursor = self.conn.cursor()
+                if 'id' in project_data and project_data['id']:
+                    # Update existing project
+                    project_id = project_data['id']
+                    cursor.execute(self._stmts['save_upd'],
+                                   (project_data['name'], data_json, rows_blob, project_id))
+                else:
+                    # Insert new project
+                    cursor.execute(self._stmts['save_new'],
+                                   (project_data['name'], data_json, rows_blob))
+                    project_id = cursor.lastrowid
+                if settings is not None:
+                    stored = self._write_settings(dict(settings, last_project=project_id))
             
-            self.conn.commit()
+            # Only reflect the ids once the transaction has committed
+            project_data['id'] = project_id
+            if settings is not None:
+                settings['last_project'] = project_id
+                self._settings = stored
+            self._list_cache.clear()
             return project_data
         except sqlite3.Error as e:
             print(f"Error saving project: {str(e)}")
@@ -349,15 +1078,14 @@ class DatabaseManager:
         """Load project from database"""
         try:
             cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT id, name, created_at, updated_at, data
-                FROM projects
-                WHERE id = ?
-            ''', (project_id,))
+            cursor.execute(self._stmts['load'], (project_id,))
             row = cursor.fetchone()
             
             if row:
-                project_data = json.loads(row[4])
+                project_data = self._unpack_tables(json_loads(row[4]), row[5])
+                for key in self.COLUMNAR_KEYS:
+                    if isinstance(project_data.get(key), list):
+                        project_data[key] = self.rows_to_columns(project_data[key])
                 project_data.update({
                     'id': row[0],
                     'name': row[1],
@@ -370,16 +1098,137 @@ class DatabaseManager:
             print(f"Error loading project: {str(e)}")
             return None
     
-    def list_projects(self):
-        """List all projects"""
+    def _pack_tables(self, project_data):
+        """Split per-row tables out of a project into a columnar .npz blob
+        
+        Numeric columns of a table (numbers and None) are stored together as
+        one float64 matrix and all-string columns (e.g. Time) as string
+        arrays; tables with any other column stay in the JSON data. Returns
+        (metadata, blob): metadata is the project without those tables plus
+        a "_tables" index of column names, blob is None when there is
+        nothing tabular to store.
+        """
+        metadata = dict(project_data)
+        arrays = {}
+        tables = {}
+        
+        for key in self.TABLE_KEYS:
+            table = project_data.get(key)
+            if not table:
+                continue
+            if isinstance(table, dict):
+                names = list(table)
+                columns = list(table.values())
+                if any(not isinstance(column, list) or len(column) != len(columns[0])
+                       for column in columns):
+                    continue  # Ragged columns stay in the JSON data
+                layout = "columns"
+            elif isinstance(table, list):
+                names = list(table[0])
+                if any(list(row) != names for row in table):
+                    continue  # Irregular rows stay in the JSON data
+                columns = [[row[name] for row in table] for name in names]
+                layout = "rows"
+            else:
+                continue
+            
+            kinds = [self._column_kind(values) for values in columns]
+            if None in kinds:
+                continue  # Mixed-type columns stay in the JSON data
+            
+            numeric, text = [], []
+            for i, (values, kind) in enumerate(zip(columns, kinds)):
+                if kind == "text":
+                    arrays[f"{key}_text_{i}"] = np.asarray(values, dtype=np.str_)
+                    text.append(i)
+                else:
+                    numeric.append([np.nan if value is None else value for value in values])
+            if numeric:
+                matrix = np.array(numeric, dtype=np.float64).T
+                arrays[key] = matrix
+                # None cells are NaN in the matrix; remember them apart from real NaNs
+                missing = np.array([[value is None for value in values]
+                                    for values, kind in zip(columns, kinds) if kind == "numeric"]).T
+                if missing.any():
+                    arrays[f"{key}_none"] = missing
+            
+            tables[key] = {"columns": names, "text": text, "layout": layout}
+            del metadata[key]
+        
+        if not tables:
+            return metadata, None
+        
+        metadata["_tables"] = tables
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, **arrays)
+        return metadata, buffer.getvalue()
+    
+    @staticmethod
+    def _column_kind(values):
+        """"text" for all-string columns, "numeric" for numbers and None, else None"""
+        if all(isinstance(value, str) for value in values):
+            return "text"
+        if all(value is None or (isinstance(value, (int, float, np.integer, np.floating))
+                                 and not isinstance(value, (bool, np.bool_)))
+               for value in values):
+            return "numeric"
+        return None
+    
+    def _unpack_tables(self, metadata, rows_blob):
+        """Inverse of _pack_tables"""
+        tables = metadata.pop("_tables", None)
+        if not tables or rows_blob is None:
+            return metadata
+        
+        with np.load(io.BytesIO(rows_blob), allow_pickle=False) as npz:
+            for key, table in tables.items():
+                names = table["columns"]
+                text = set(table["text"])
+                numeric = npz[key].T.tolist() if key in npz.files else []
+                if f"{key}_none" in npz.files:
+                    numeric = [[None if none else value for value, none in zip(values, nones)]
+                               for values, nones in zip(numeric, npz[f"{key}_none"].T.tolist())]
+                numeric = iter(numeric)
+                columns = [npz[f"{key}_text_{i}"].tolist() if i in text else next(numeric)
+                           for i in range(len(names))]
+                if table.get("layout") == "columns":
+                    metadata[key] = dict(zip(names, columns))
+                else:
+                    metadata[key] = [dict(zip(names, row)) for row in zip(*columns)]
+        return metadata
+    
+    @staticmethod
+    def rows_to_columns(rows):
+        """Convert a list of row dicts to {column: list}
+        
+        Columns missing from some rows are filled with "" when the column
+        holds text and 0.0 otherwise.
+        """
+        names = list(dict.fromkeys(name for row in rows for name in row))
+        columns = {}
+        for name in names:
+            values = [row.get(name) for row in rows]
+            fill = "" if any(isinstance(value, str) for value in values) else 0.0
+            columns[name] = [fill if value is None else value for value in values]
+        return columns
+    
+    def list_projects(self, limit=100, offset=0, search=None):
+        """List one page of projects, most recently updated first"""
+        key = (limit, offset, search)
+        cached = self._list_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.LIST_CACHE_TTL:
+            return list(cached[1])
+        
         try:
             cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT id, name, created_at, updated_at
-                FROM projects
-                ORDER BY updated_at DESC
-            ''')
-            return cursor.fetchall()
+            if search:
+                pattern = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                cursor.execute(self._stmts['list_search'], (f"%{pattern}%", limit, offset))
+            else:
+                cursor.execute(self._stmts['list'], (limit, offset))
+            rows = cursor.fetchall()
+            self._list_cache[key] = (time.monotonic(), rows)
+            return list(rows)
         except sqlite3.Error as e:
             print(f"Error listing projects: {str(e)}")
             return []
@@ -388,80 +1237,342 @@ class DatabaseManager:
         """Get user settings"""
         try:
             cursor = self.conn.cursor()
-            cursor.execute('SELECT language, theme, unit_system, last_project FROM settings WHERE id = 1')
+            cursor.execute(self._stmts['settings_get'])
             row = cursor.fetchone()
             if row:
-                return {
-                    'language': row[0],
-                    'theme': row[1],
-                    'unit_system': row[2],
-                    'last_project': row[3]
-                }
+                self._settings = dict(zip(self.SETTINGS_DEFAULTS, row))
+                return dict(self._settings)
             return None
         except sqlite3.Error as e:
             print(f"Error getting settings: {str(e)}")
             return None
     
     def save_settings(self, settings):
-        """Save user settings"""
+        """Save user settings, writing only the columns that changed"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                UPDATE settings
-                SET language = ?, theme = ?, unit_system = ?, last_project = ?
-                WHERE id = 1
-            ''', (
-                settings.get('language', 'en'),
-                settings.get('theme', 'dark'),
-                settings.get('unit_system', 'imperial'),
-                settings.get('last_project')
-            ))
-            self.conn.commit()
+            with self.conn:
+                stored = self._write_settings(settings)
+            self._settings = stored
             return True
         except sqlite3.Error as e:
             print(f"Error saving settings: {str(e)}")
             return False
+    
+    def _write_settings(self, settings):
+        """UPDATE the changed settings columns (no commit); return all values"""
+        values = {key: settings.get(key, default) for key, default in self.SETTINGS_DEFAULTS.items()}
+        stored = self._settings or {}
+        changed = [key for key in values if key not in stored or stored[key] != values[key]]
+        if changed:
+            self.conn.execute(
+                f"UPDATE settings SET {', '.join(f'{key} = ?' for key in changed)} WHERE id = 1",
+                [values[key] for key in changed]
+            )
+        return values
 
 # =====================
 # UI COMPONENTS
 # =====================
+# Scaled logo pixmaps keyed by height
+_LOGO_CACHE = {}
+# Logos decoded by preload_logo: height -> (done event, [QImage])
+_LOGO_IMAGES = {}
+
+
+def _load_logo_image(height):
+    """Decode the logo and scale it to height (QImage, so any thread may call this)"""
+    image = QImage(":/icons/logo.png")
+    if image.isNull():
+        image = QImage("logo.png")  # fallback if resource path fails
+    if image.isNull():
+        return image
+    # Scale in the premultiplied format QPixmap uses, as QPixmap.scaled would
+    image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+    return image.scaledToHeight(height, Qt.SmoothTransformation)
+
+
+def preload_logo(height):
+    """Start decoding the logo on the thread pool ahead of logo_pixmap(height)"""
+    if height in _LOGO_IMAGES or height in _LOGO_CACHE:
+        return
+    done, image = threading.Event(), []
+    _LOGO_IMAGES[height] = (done, image)
+    
+    def load():
+        try:
+            image.append(_load_logo_image(height))
+        finally:
+            done.set()
+    
+    QThreadPool.globalInstance().start(load)
+
+
+def logo_pixmap(height):
+    """Return the application logo scaled to height, loading it only once"""
+    pixmap = _LOGO_CACHE.get(height)
+    if pixmap is None:
+        # Use a finished preload; one still queued or running is not waited
+        # for, since the pool may be busy with other work
+        done, image = _LOGO_IMAGES.pop(height, (None, None))
+        if done is None or not done.is_set() or not image:
+            image = [_load_logo_image(height)]
+        # QPixmap may only be created on the UI thread
+        pixmap = QPixmap.fromImage(image[0])
+        _LOGO_CACHE[height] = pixmap
+    return pixmap
+
+
 class GradientButton(QPushButton):
+    # Gradients shared between buttons with the same colors and height
+    _gradient_cache = {}
+    # The cached background bakes the window's background color into the corners,
+    # so Qt can skip erasing behind the button. Turn off if buttons end up on
+    # a background that differs from the palette (corners would show it).
+    OPAQUE_PAINT = True
+    
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
         self.setMinimumHeight(40)
         self.setFont(QFont("Arial", 10, QFont.Bold))
-        self._gradient = QLinearGradient(0, 0, 0, self.height())
-        self._gradient.setColorAt(0, QColor("#3498db"))
-        self._gradient.setColorAt(1, QColor("#2980b9"))
-        self._text_color = QColor("#ffffff")
+        if self.OPAQUE_PAINT:
+            self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+            self.setAutoFillBackground(False)
+        self._gradient = self._get_gradient(*GRADIENT_BLUE, self.height())
+        self._text_color = BUTTON_TEXT_COLOR
+        # Pre-rendered rounded-rect background, rebuilt when the size changes
+        self._bg_cache = None
+        self._cache_size = QSize()
+        
+    @classmethod
+    def _get_gradient(cls, start_color, end_color, height):
+        """Return the shared vertical gradient for these colors and height"""
+        key = (start_color.rgba(), end_color.rgba(), height)
+        gradient = cls._gradient_cache.get(key)
+        if gradient is None:
+            gradient = QLinearGradient(0, 0, 0, height)
+            gradient.setColorAt(0, start_color)
+            gradient.setColorAt(1, end_color)
+            cls._gradient_cache[key] = gradient
+        return gradient
+        
+    def _render_background(self):
+        """Render the gradient background into a pixmap matching the widget"""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        if self.OPAQUE_PAINT:
+            pixmap.fill(self.window().palette().color(QPalette.Window))
+        else:
+            pixmap.fill(Qt.transparent)
         
-    def paintEvent(self, event):
-        painter = QPainter(self)
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Draw background
         painter.setBrush(QBrush(self._gradient))
         painter.setPen(Qt.NoPen)
         painter.drawRoundedRect(self.rect(), 5, 5)
+        painter.end()
+        
+        self._bg_cache = pixmap
+        self._cache_size = self.size()
+        
+    def paintEvent(self, event):
+        # Draw background
+        if self._bg_cache is None or self.size() != self._cache_size:
+            self._render_background()
+        # Only the exposed part of the cached background is blitted
+        dirty = event.rect().intersected(self.rect())
+        dpr = self._bg_cache.devicePixelRatio()
+        painter = QPainter(self)
+        painter.setClipRect(dirty)
+        painter.drawPixmap(QRectF(dirty), self._bg_cache,
+                           QRectF(dirty.x() * dpr, dirty.y() * dpr,
+                                  dirty.width() * dpr, dirty.height() * dpr))
         
         # Draw text
         painter.setPen(QPen(self._text_color))
         painter.drawText(self.rect(), Qt.AlignCenter, self.text())
         
+    def resizeEvent(self, event):
+        self._bg_cache = None
+        super().resizeEvent(event)
+        
+    def changeEvent(self, event):
+        # Theme switches change the corner color baked into the cache
+        if event.type() == QEvent.PaletteChange:
+            self._bg_cache = None
+        super().changeEvent(event)
+        
     def setGradient(self, start_color, end_color):
-        self._gradient = QLinearGradient(0, 0, 0, self.height())
-        self._gradient.setColorAt(0, start_color)
-        self._gradient.setColorAt(1, end_color)
+        gradient = self._get_gradient(start_color, end_color, self.height())
+        if gradient is self._gradient:
+            return
+        self._gradient = gradient
+        self._bg_cache = None
         self.update()
         
     def setTextColor(self, color):
+        if color == self._text_color:
+            return
         self._text_color = color
         self.update()
 
+class NumericTableModel(QAbstractTableModel):
+    """Table model over a float64 array
+    
+    Numbers live in one array instead of per-cell items. Cells of text
+    columns and cells entered through set_rows/setData also keep their
+    text, so they are shown as entered and non-numbers can be reported back.
+    """
+    def __init__(self, editable=False, parent=None):
+        super().__init__(parent)
+        self._editable = editable
+        self._headers = []
+        self._text_columns = set()
+        self._formats = {}
+        self._display = {}  # col -> formatted text of the whole column
+        self._values = np.zeros((0, 0))
+        self._filled = np.zeros((0, 0), dtype=bool)
+        self._text = {}
+        self._row_brushes = {}
+    
+    def reset(self, headers, rows, text_columns=(), formats=None):
+        """Replace the layout with empty rows under the given headers"""
+        self.beginResetModel()
+        self._headers = list(headers)
+        self._text_columns = set(text_columns)
+        self._formats = dict(formats or {})
+        self._display = {}
+        self._values = np.zeros((rows, len(self._headers)))
+        self._filled = np.zeros((rows, len(self._headers)), dtype=bool)
+        self._text = {}
+        self._row_brushes = {}
+        self.endResetModel()
+    
+    def set_array(self, values, text=None):
+        """Load a full (rows, columns) array plus {(row, col): text} cells"""
+        self.beginResetModel()
+        self._values = np.array(values, dtype=np.float64, ndmin=2)
+        self._filled = np.ones(self._values.shape, dtype=bool)
+        self._text = dict(text or {})
+        self._display = {}
+        self._row_brushes = {}
+        self.endResetModel()
+    
+    def set_rows(self, rows):
+        """Load rows of Python values (None for empty cells)"""
+        self.beginResetModel()
+        shape = (len(rows), len(self._headers))
+        self._values = np.zeros(shape)
+        self._filled = np.zeros(shape, dtype=bool)
+        self._text = {}
+        self._display = {}
+        self._row_brushes = {}
+        for row, row_values in enumerate(rows):
+            for col, value in enumerate(row_values[:shape[1]]):
+                if value is not None:
+                    self._store(row, col, value)
+        self.endResetModel()
+    
+    def set_row_background(self, row, brush):
+        self._row_brushes[row] = brush
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1),
+                              [Qt.BackgroundRole])
+    
+    def headers(self):
+        return list(self._headers)
+    
+    def values(self):
+        """The numeric cells as a float64 array (unfilled cells are 0)"""
+        return self._values
+    
+    def cell_text(self, row, col):
+        """Text of a cell as displayed ("" when empty)"""
+        if (row, col) in self._text:
+            return self._text[(row, col)]
+        if col in self._text_columns or not self._filled[row, col]:
+            return ""
+        spec = self._formats.get(col)
+        if not spec:
+            return str(self._values[row, col].item())
+        display = self._display.get(col)
+        if display is None:
+            # Format the whole column in one NumPy call on first display
+            display = self._display[col] = np.char.mod("%" + spec, self._values[:, col])
+        return str(display[row])
+    
+    def problem_cells(self, columns):
+        """(row, col, kind) of empty or non-numeric cells, row by row
+        
+        kind is "missing" or "invalid"; only the given columns are checked.
+        """
+        columns = list(columns)
+        problems = []
+        rows, cols = np.nonzero(~self._filled[:, columns])
+        for row, i in zip(rows.tolist(), cols.tolist()):
+            col = columns[i]
+            problems.append((row, col, "invalid" if (row, col) in self._text else "missing"))
+        return problems
+    
+    def _store(self, row, col, value):
+        text = value if isinstance(value, str) else str(value)
+        self._text.pop((row, col), None)
+        self._display.pop(col, None)
+        if col in self._text_columns:
+            self._filled[row, col] = bool(text)
+            if text:
+                self._text[(row, col)] = text
+            return
+        try:
+            self._values[row, col] = float(text.strip() if isinstance(value, str) else value)
+            self._filled[row, col] = True
+            # Show the cell as it was entered ("5", "1e3"); the float is for calculations
+            self._text[(row, col)] = text
+        except (TypeError, ValueError):
+            self._filled[row, col] = False
+            if text.strip():
+                self._text[(row, col)] = text
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._values.shape[0]
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            text = self.cell_text(index.row(), index.column())
+            return text if text or role == Qt.EditRole else None
+        if role == Qt.BackgroundRole:
+            return self._row_brushes.get(index.row())
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section] if section < len(self._headers) else None
+        return section + 1
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        self._store(index.row(), index.column(), "" if value is None else str(value))
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+    
+    def flags(self, index):
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if self._editable:
+            flags |= Qt.ItemIsEditable
+        return flags
+
 class DashboardPage(QWidget):
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
+        self._recent_projects = None  # Rows shown in recent_list
         self.setup_ui()
         
     def setup_ui(self):
@@ -474,38 +1585,27 @@ class DashboardPage(QWidget):
         # Header (Logo only, no text title)
         header_layout = QHBoxLayout()
         logo = QLabel()
-        pixmap = QPixmap(":/icons/logo.png")
-        if pixmap.isNull():
-            pixmap = QPixmap("logo.png")  # fallback if resource path fails
-        logo.setPixmap(pixmap)
+        logo.setPixmap(logo_pixmap(400))  # Pre-scaled, so the label never rescales
         logo.setAlignment(Qt.AlignCenter)
-        logo.setScaledContents(True)  # Allow the pixmap to scale with the label
-        logo.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding) # Expanding
-        logo.setMaximumHeight(400)    # Set your preferred max height
+        logo.setFixedHeight(400)
 
         header_layout.addWidget(logo, alignment=Qt.AlignCenter)
         
-        # Logo
-        logo = QLabel()
-        pixmap = QPixmap(":/icons/logo.png").scaledToHeight(400)
-        logo.setPixmap(pixmap)
-        logo.setAlignment(Qt.AlignCenter)
-        
         # Buttons
         button_layout = QVBoxLayout()
         button_layout.setSpacing(20)
         button_layout.setContentsMargins(100, 0, 100, 0)
         
         self.new_test_btn = GradientButton("Create New Test")
-        self.new_test_btn.setGradient(QColor("#2ecc71"), QColor("#27ae60"))
+        self.new_test_btn.setGradient(*GRADIENT_GREEN)
         self.new_test_btn.clicked.connect(self.parent.create_new_test)
         
         self.open_test_btn = GradientButton("Open Existing Test")
-        self.open_test_btn.setGradient(QColor("#3498db"), QColor("#2980b9"))
+        self.open_test_btn.setGradient(*GRADIENT_BLUE)
         self.open_test_btn.clicked.connect(self.parent.open_project_dialog)
         
         self.tutorials_btn = GradientButton("Tutorials")
-        self.tutorials_btn.setGradient(QColor("#9b59b6"), QColor("#8e44ad"))
+        self.tutorials_btn.setGradient(*GRADIENT_PURPLE)
         self.tutorials_btn.clicked.connect(self.parent.show_tutorials)
         
         button_layout.addWidget(self.new_test_btn)
@@ -521,7 +1621,7 @@ class DashboardPage(QWidget):
         recent_layout.addWidget(self.recent_list)
         
         open_recent_btn = GradientButton("Open Selected Project")
-        open_recent_btn.setGradient(QColor("#f39c12"), QColor("#d35400"))
+        open_recent_btn.setGradient(*GRADIENT_ORANGE)
         open_recent_btn.clicked.connect(self.open_recent_project)
         recent_layout.addWidget(open_recent_btn)
         
@@ -534,7 +1634,6 @@ class DashboardPage(QWidget):
         
         # Add to main layout
         main_layout.addLayout(header_layout)
-        main_layout.addWidget(logo, alignment=Qt.AlignCenter)
         main_layout.addStretch(1)
         main_layout.addLayout(button_layout)
         main_layout.addStretch(1)
@@ -546,10 +1645,18 @@ class DashboardPage(QWidget):
     
     def load_recent_projects(self):
         """Load recent projects from database"""
-        self.recent_list.clear()
         projects = self.parent.db.list_projects()
-        for project in projects:
-            self.recent_list.addItem(f"{project[1]} ({project[3][:10]})", project[0])
+        if projects == self._recent_projects:
+            return  # Unchanged since the last show; keep the current selection
+        self._recent_projects = projects
+        
+        # Add all labels in one call, then attach the ids, with signals off
+        self.recent_list.blockSignals(True)
+        self.recent_list.clear()
+        self.recent_list.addItems([f"{project[1]} ({project[3][:10]})" for project in projects])
+        for index, project in enumerate(projects):
+            self.recent_list.setItemData(index, project[0])
+        self.recent_list.blockSignals(False)
     
     def open_recent_project(self):
         """Open the selected recent project"""
@@ -558,6 +1665,35 @@ class DashboardPage(QWidget):
             self.parent.load_project(project_id)
 
 class ParametersPage(QWidget):
+    # Form rows as (attribute, label, spec): a (min, max[, value]) tuple
+    # makes a QDoubleSpinBox, a list of items makes a QComboBox
+    FLUID_FIELDS = (
+        ("oil_api", "Oil API obs:", (0, 100, 30)),
+        ("oil_temp", "Oil Temperature obs (°C):", (-50, 300, 60)),
+        ("salinity", "Salinity (PPM):", (0, 1000000, 50000)),
+        ("meter_factor", "Meter Factor:", (0.5, 1.5, 1.0)),
+    )
+    CONFIG_FIELDS = (
+        ("production_type", "Production Type:", ["NATURAL FLOW", "GAS LIFT", "ESP"]),
+        ("separation_type", "Separation Type:", ["THREE PHASES", "TWO PHASES"]),
+        ("flow_type", "Flow Type:", ["TUBING", "ANNULUS"]),
+        ("gor2_method", "GOR2 Method:", ["API", "KATZ", "VASQUEZ BEGGS", "STANDING'S"]),
+    )
+    GAS_FIELDS = (
+        ("line_bore", "Line Bore (ID) (in):", (0.1, 100, 4.0)),
+        ("dp_range", "DP Range (inH₂O):", ["0-100", "0-200", "0-300", "0-400"]),
+        ("h2s", "H₂S (PPM):", (0, 1000000)),
+        ("co2", "CO₂ (PPM):", (0, 1000000)),
+        ("n2", "N₂ (PPM):", (0, 1000000)),
+        ("orifice_diameter", "Orifice Diameter (in):", (0.1, 100, 2.0)),
+        ("pressure_range", "Pressure Range (PSI):", ["0-1000", "0-1500", "0-2000"]),
+        ("sg_gas", "SG Gas:", (0.1, 2.0, 0.65)),
+    )
+    GAS_INJ_FIELDS = (
+        ("gas_inj_coeff", "Coefficient:", (0, 10, 1.0)),
+        ("gas_inj_orifice", "Orifice Plate (in):", (0.1, 10, 1.5)),
+    )
+    
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
@@ -572,6 +1708,7 @@ class ParametersPage(QWidget):
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
         scroll_content = QWidget()
+        scroll_content.setUpdatesEnabled(False)  # One layout pass once all rows exist
         scroll_layout = QVBoxLayout(scroll_content)
         
         # Well Information
@@ -591,104 +1728,11 @@ class ParametersPage(QWidget):
         well_layout.addRow("Well Name:", self.well_name)
         well_group.setLayout(well_layout)
         
-        # Fluid Properties
-        fluid_group = QGroupBox("Fluid Properties")
-        fluid_layout = QFormLayout()
-        fluid_layout.setHorizontalSpacing(20)
-        fluid_layout.setVerticalSpacing(10)
-        
-        self.oil_api = QDoubleSpinBox()
-        self.oil_api.setRange(0, 100)
-        self.oil_api.setValue(30)
-        self.oil_temp = QDoubleSpinBox()
-        self.oil_temp.setRange(-50, 300)
-        self.oil_temp.setValue(60)
-        self.salinity = QDoubleSpinBox()
-        self.salinity.setRange(0, 1000000)
-        self.salinity.setValue(50000)
-        self.meter_factor = QDoubleSpinBox()
-        self.meter_factor.setRange(0.5, 1.5)
-        self.meter_factor.setValue(1.0)
-        
-        fluid_layout.addRow("Oil API obs:", self.oil_api)
-        fluid_layout.addRow("Oil Temperature obs (°C):", self.oil_temp)
-        fluid_layout.addRow("Salinity (PPM):", self.salinity)
-        fluid_layout.addRow("Meter Factor:", self.meter_factor)
-        fluid_group.setLayout(fluid_layout)
-        
-        # Well & Separator Configuration
-        config_group = QGroupBox("Well & Separator Configuration")
-        config_layout = QFormLayout()
-        config_layout.setHorizontalSpacing(20)
-        config_layout.setVerticalSpacing(10)
-        
-        self.production_type = QComboBox()
-        self.production_type.addItems(["NATURAL FLOW", "GAS LIFT", "ESP"])
-        self.separation_type = QComboBox()
-        self.separation_type.addItems(["THREE PHASES", "TWO PHASES"])
-        self.flow_type = QComboBox()
-        self.flow_type.addItems(["TUBING", "ANNULUS"])
-        self.gor2_method = QComboBox()
-        self.gor2_method.addItems(["API", "KATZ", "VASQUEZ BEGGS", "STANDING'S"])
-        
-        config_layout.addRow("Production Type:", self.production_type)
-        config_layout.addRow("Separation Type:", self.separation_type)
-        config_layout.addRow("Flow Type:", self.flow_type)
-        config_layout.addRow("GOR2 Method:", self.gor2_method)
-        config_group.setLayout(config_layout)
-        
-        # Gas Measurement
-        gas_group = QGroupBox("Gas Measurement")
-        gas_layout = QFormLayout()
-        gas_layout.setHorizontalSpacing(20)
-        gas_layout.setVerticalSpacing(10)
-        
-        self.line_bore = QDoubleSpinBox()
-        self.line_bore.setRange(0.1, 100)
-        self.line_bore.setValue(4.0)
-        self.dp_range = QComboBox()
-        self.dp_range.addItems(["0-100", "0-200", "0-300", "0-400"])
-        self.h2s = QDoubleSpinBox()
-        self.h2s.setRange(0, 1000000)
-        self.co2 = QDoubleSpinBox()
-        self.co2.setRange(0, 1000000)
-        self.n2 = QDoubleSpinBox()
-        self.n2.setRange(0, 1000000)
-        self.orifice_diameter = QDoubleSpinBox()
-        self.orifice_diameter.setRange(0.1, 100)
-        self.orifice_diameter.setValue(2.0)
-        self.pressure_range = QComboBox()
-        self.pressure_range.addItems(["0-1000", "0-1500", "0-2000"])
-        self.sg_gas = QDoubleSpinBox()
-        self.sg_gas.setRange(0.1, 2.0)
-        self.sg_gas.setValue(0.65)
-        
-        gas_layout.addRow("Line Bore (ID) (in):", self.line_bore)
-        gas_layout.addRow("DP Range (inH₂O):", self.dp_range)
-        gas_layout.addRow("H₂S (PPM):", self.h2s)
-        gas_layout.addRow("CO₂ (PPM):", self.co2)
-        gas_layout.addRow("N₂ (PPM):", self.n2)
-        gas_layout.addRow("Orifice Diameter (in):", self.orifice_diameter)
-        gas_layout.addRow("Pressure Range (PSI):", self.pressure_range)
-        gas_layout.addRow("SG Gas:", self.sg_gas)
-        gas_group.setLayout(gas_layout)
-        
-        # Gas Injection Line
-        self.gas_inj_group = QGroupBox("Gas Injection Line")
-        gas_inj_layout = QFormLayout()
-        gas_inj_layout.setHorizontalSpacing(20)
-        gas_inj_layout.setVerticalSpacing(10)
-        
-        self.gas_inj_coeff = QDoubleSpinBox()
-        self.gas_inj_coeff.setRange(0, 10)
-        self.gas_inj_coeff.setValue(1.0)
-        self.gas_inj_orifice = QDoubleSpinBox()
-        self.gas_inj_orifice.setRange(0.1, 10)
-        self.gas_inj_orifice.setValue(1.5)
-        
-        gas_inj_layout.addRow("Coefficient:", self.gas_inj_coeff)
-        gas_inj_layout.addRow("Orifice Plate (in):", self.gas_inj_orifice)
-        self.gas_inj_group.setLayout(gas_inj_layout)
+        # Parameter groups from the specs above
+        fluid_group = self._build_group("Fluid Properties", self.FLUID_FIELDS)
+        config_group = self._build_group("Well & Separator Configuration", self.CONFIG_FIELDS)
+        gas_group = self._build_group("Gas Measurement", self.GAS_FIELDS)
+        self.gas_inj_group = self._build_group("Gas Injection Line", self.GAS_INJ_FIELDS)
         self.gas_inj_group.setVisible(False)
         
         # Connect production type change
@@ -703,14 +1747,15 @@ class ParametersPage(QWidget):
         scroll_layout.addStretch()
         
         scroll_area.setWidget(scroll_content)
+        scroll_content.setUpdatesEnabled(True)
         
         # Navigation buttons
         nav_layout = QHBoxLayout()
         self.cancel_btn = GradientButton("Cancel")
-        self.cancel_btn.setGradient(QColor("#e74c3c"), QColor("#c0392b"))
+        self.cancel_btn.setGradient(*GRADIENT_RED)
         self.cancel_btn.clicked.connect(lambda: self.parent.show_page("DASHBOARD"))
         self.save_btn = GradientButton("Save & Continue")
-        self.save_btn.setGradient(QColor("#2ecc71"), QColor("#27ae60"))
+        self.save_btn.setGradient(*GRADIENT_GREEN)
         self.save_btn.clicked.connect(self.save_parameters)
         
         nav_layout.addWidget(self.cancel_btn)
@@ -723,6 +1768,28 @@ class ParametersPage(QWidget):
         
         self.setLayout(main_layout)
     
+    def _build_group(self, title, fields):
+        """Build a form group box, storing each widget as an attribute"""
+        group = QGroupBox(title)
+        layout = QFormLayout()
+        layout.setHorizontalSpacing(20)
+        layout.setVerticalSpacing(10)
+        
+        for name, label, spec in fields:
+            if isinstance(spec, list):
+                widget = QComboBox()
+                widget.addItems(spec)
+            else:
+                widget = QDoubleSpinBox()
+                widget.setRange(spec[0], spec[1])
+                if len(spec) > 2:
+                    widget.setValue(spec[2])
+            setattr(self, name, widget)
+            layout.addRow(label, widget)
+        
+        group.setLayout(layout)
+        return group
+    
     def toggle_gas_inj(self, production_type):
         self.gas_inj_group.setVisible(production_type == "GAS LIFT")
     
@@ -753,6 +1820,7 @@ class ParametersPage(QWidget):
         }
         
         self.parent.current_project["parameters"] = params
+        self.parent.mark_dirty()
         self.parent.show_page("DATA_ENTRY")
 
 class DataEntryPage(QWidget):
@@ -768,10 +1836,10 @@ class DataEntryPage(QWidget):
         # Header
         header_layout = QHBoxLayout()
         self.title = QLabel("Data Entry")
-        self.title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        self.title.setStyleSheet(PAGE_TITLE_STYLE)
         
         self.import_btn = GradientButton("Import from Excel")
-        self.import_btn.setGradient(QColor("#3498db"), QColor("#2980b9"))
+        self.import_btn.setGradient(*GRADIENT_BLUE)
         self.import_btn.clicked.connect(self.import_from_excel)
         
         header_layout.addWidget(self.title)
@@ -779,30 +1847,22 @@ class DataEntryPage(QWidget):
         header_layout.addWidget(self.import_btn)
         
         # Data table
-        self.table = QTableWidget()
-        self.table.setRowCount(12)  # 6 hours * 30 min intervals
+        self.model = NumericTableModel(editable=True, parent=self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        # Sections get this width whenever the model resets
+        self.table.horizontalHeader().setDefaultSectionSize(120)
         self.table.verticalHeader().setVisible(False)
         self.table.setAlternatingRowColors(True)
-        self.table.setStyleSheet("""
-            QTableWidget {
-                gridline-color: #d0d0d0;
-                alternate-background-color: #171515;
-            }
-            QHeaderView::section {
-                background-color: #2c3e50;
-                color: white;
-                padding: 4px;
-                border: 1px solid #1a2a3a;
-            }
-        """)
+        self.table.setStyleSheet(TABLE_STYLE)
         
         # Navigation
         nav_layout = QHBoxLayout()
         self.back_btn = GradientButton("Back")
-        self.back_btn.setGradient(QColor("#95a5a6"), QColor("#7f8c8d"))
+        self.back_btn.setGradient(*GRADIENT_GREY)
         self.back_btn.clicked.connect(lambda: self.parent.show_page("PARAMETERS"))
         self.calculate_btn = GradientButton("Calculate Results")
-        self.calculate_btn.setGradient(QColor("#2ecc71"), QColor("#27ae60"))
+        self.calculate_btn.setGradient(*GRADIENT_GREEN)
         self.calculate_btn.clicked.connect(self.calculate_results)
         
         nav_layout.addWidget(self.back_btn)
@@ -820,11 +1880,7 @@ class DataEntryPage(QWidget):
         separation_type = params["separation_type"]
         production_type = params["production_type"]
         
-        self.table.clear()
-        self.table.setColumnCount(0)
-        
-        columns = ["Time", "Choke", "WHP (PSIG)", "WHT (°C)", "Casing (PSIG)", 
-                   "SEP P (PSIG)", "GAS T (°C)", "Oil Outlet P (PSIG)", "Oil T (°C)"]
+        columns = list(DATA_COLUMNS_BASE)
         
         if separation_type == "THREE PHASES":
             columns.extend(["Meter Oil (BBL)", "Meter Water (BBL)", "WIO (%)"])
@@ -836,26 +1892,17 @@ class DataEntryPage(QWidget):
         if production_type == "GAS LIFT":
             columns.append("Q Gas Inj (MSCF/D)")
         
-        self.table.setColumnCount(len(columns))
-        self.table.setHorizontalHeaderLabels(columns)
-        
-        # Set column widths
-        for i in range(len(columns)):
-            self.table.setColumnWidth(i, 120)
-        
-        # Set initial time values
-        for i in range(12):
-            hours = i // 2
-            minutes = 30 * (i % 2)
-            time_item = QTableWidgetItem(f"{hours:02d}:{minutes:02d}")
-            # time_item.setFlags(time_item.flags() ^ Qt.ItemIsEditable)  # Allow editing
-            self.table.setItem(i, 0, time_item)
-        
-        # Set initial values for meters
+        # Set initial time values and zeroed meters
         start_col = 9 if separation_type == "THREE PHASES" else 8
-        for i in range(12):
-            zero_item = QTableWidgetItem("0.0")
-            self.table.setItem(i, start_col, zero_item)
+        rows = []
+        for time_label in TIME_LABELS:
+            row = [None] * len(columns)
+            row[0] = time_label
+            row[start_col] = 0.0
+            rows.append(row)
+        
+        self.model.reset(columns, 0, text_columns=[0])
+        self.model.set_rows(rows)
     
     def import_from_excel(self):
         file_path, _ = QFileDialog.getOpenFileName(
@@ -864,49 +1911,62 @@ class DataEntryPage(QWidget):
         
         if file_path:
             try:
-                df = pd.read_excel(file_path)
+                if file_path.lower().endswith(".xlsx"):
+                    # Stream cell values only; styles and formulas are not loaded
+                    import openpyxl
+                    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+                    try:
+                        rows = list(workbook.active.iter_rows(min_row=2, values_only=True))
+                    finally:
+                        workbook.close()
+                else:
+                    # Legacy .xls files need pandas' xlrd engine
+                    import pandas as pd
+                    df = pd.read_excel(file_path)
+                    rows = list(df.astype(object).where(df.notna(), None).itertuples(index=False, name=None))
+                
                 # Process and populate table
+                self.populate_table(rows)
                 QMessageBox.information(self, "Import Successful", "Data imported successfully!")
             except Exception as e:
                 QMessageBox.critical(self, "Import Error", f"Failed to import data: {str(e)}")
     
+    def populate_table(self, rows):
+        """Fill the table from imported rows, values in table column order"""
+        # Excel time cells come back as datetime.time/datetime
+        self.model.set_rows([
+            [value.strftime("%H:%M") if hasattr(value, "strftime") else value for value in row]
+            for row in rows if any(value is not None for value in row)
+        ])
+    
     def calculate_results(self):
-        # Collect and validate data
-        data = []
-        valid = True
-        errors = []
+        # The model already holds the cells as numbers; only empty or
+        # non-numeric cells need reporting
+        headers = self.model.headers()
+        time_cols = [col for col, header in enumerate(headers) if header == "Time"]
+        numeric = [col for col, header in enumerate(headers) if header != "Time"]
         
-        for row in range(self.table.rowCount()):
-            row_data = {}
-            for col in range(self.table.columnCount()):
-                header = self.table.horizontalHeaderItem(col).text()
-                item = self.table.item(row, col)
-                
-                if item and item.text():
-                    try:
-                        # Skip time column
-                        if header == "Time":
-                            row_data[header] = item.text()
-                        else:
-                            row_data[header] = float(item.text())
-                    except:
-                        errors.append(f"Invalid number in row {row+1}, column '{header}'")
-                        valid = False
-                else:
-                    if col > 0:  # Skip time column
-                        errors.append(f"Missing value in row {row+1}, column '{header}'")
-                        valid = False
-                        row_data[header] = 0.0
-            
-            data.append(row_data)
+        errors = []
+        for row, col, kind in self.model.problem_cells(numeric):
+            if kind == "invalid":
+                errors.append(f"Invalid number in row {row+1}, column '{headers[col]}'")
+            else:
+                errors.append(f"Missing value in row {row+1}, column '{headers[col]}'")
         
-        if not valid:
+        if errors:
             QMessageBox.critical(self, "Data Error", "\n".join(errors))
             return
         
+        # One list per column, Time first as in the table
+        rows = range(self.model.rowCount())
+        data = {headers[col]: [self.model.cell_text(row, col) for row in rows] for col in time_cols}
+        values = self.model.values()
+        for col in numeric:
+            data[headers[col]] = values[:, col].tolist()
+        
+        # The results page is shown once the calculation finishes
         self.parent.current_project["time_series"] = data
         self.parent.perform_calculations()
-        self.parent.show_page("RESULTS")
 
 class ResultsPage(QWidget):
     def __init__(self, parent):
@@ -921,10 +1981,10 @@ class ResultsPage(QWidget):
         # Header
         header_layout = QHBoxLayout()
         self.title = QLabel("Test Results")
-        self.title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        self.title.setStyleSheet(PAGE_TITLE_STYLE)
         
         self.export_btn = GradientButton("Export to PDF")
-        self.export_btn.setGradient(QColor("#e74c3c"), QColor("#c0392b"))
+        self.export_btn.setGradient(*GRADIENT_RED)
         self.export_btn.clicked.connect(self.parent.export_report)
         
         header_layout.addWidget(self.title)
@@ -932,30 +1992,22 @@ class ResultsPage(QWidget):
         header_layout.addWidget(self.export_btn)
         
         # Results table
-        self.table = QTableWidget()
+        self.model = NumericTableModel(parent=self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.horizontalHeader().setDefaultSectionSize(150)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.verticalHeader().setVisible(False)
         self.table.setAlternatingRowColors(True)
-        self.table.setStyleSheet("""
-            QTableWidget {
-                gridline-color: #d0d0d0;
-                alternate-background-color: #171515;
-            }
-            QHeaderView::section {
-                background-color: #2c3e50;
-                color: white;
-                padding: 4px;
-                border: 1px solid #1a2a3a;
-            }
-        """)
+        self.table.setStyleSheet(TABLE_STYLE)
         
         # Navigation
         nav_layout = QHBoxLayout()
         self.back_btn = GradientButton("Back to Data")
-        self.back_btn.setGradient(QColor("#95a5a6"), QColor("#7f8c8d"))
+        self.back_btn.setGradient(*GRADIENT_GREY)
         self.back_btn.clicked.connect(lambda: self.parent.show_page("DATA_ENTRY"))
         self.plots_btn = GradientButton("View Plots")
-        self.plots_btn.setGradient(QColor("#9b59b6"), QColor("#8e44ad"))
+        self.plots_btn.setGradient(*GRADIENT_PURPLE)
         self.plots_btn.clicked.connect(lambda: self.parent.show_page("PLOTS"))
         
         nav_layout.addWidget(self.back_btn)
@@ -976,81 +2028,54 @@ class ResultsPage(QWidget):
         # Determine columns based on production type
         production_type = self.parent.current_project["parameters"]["production_type"]
         
-        columns = ["Time", "Q Oil (BBL/D)", "Q Water (BBL/D)", "Total Q (BBL/D)"]
-        
         if production_type == "GAS LIFT":
-            columns.extend([
-                "Q Gas (MSCF/D)", "Formation Gas (MSCF/D)", "GOR1 (SCF/STB)", 
-                "GOR1 Formation (SCF/STB)", "GOR2 (SCF/STB)", "Total GOR Formation (SCF/STB)", "Total GOR (SCF/STB)"
-            ])
+            result_fields = RESULT_FIELDS_BASE + RESULT_FIELDS_GAS_LIFT
         else:
-            columns.extend([
-                "Q Gas (MSCF/D)", "GOR1 (SCF/STB)", "GOR2 (SCF/STB)", "Total GOR (SCF/STB)"
-            ])
-        
-        self.table.setRowCount(len(results))
-        self.table.setColumnCount(len(columns))
-        self.table.setHorizontalHeaderLabels(columns)
-        
-        # Set column widths
-        for i in range(len(columns)):
-            self.table.setColumnWidth(i, 150)
-        
-        # Populate table
-        for row_idx, result in enumerate(results):
-            self.table.setItem(row_idx, 0, QTableWidgetItem(result["Time"]))
-            self.table.setItem(row_idx, 1, QTableWidgetItem(f"{result['Q Oil']:.2f}"))
-            self.table.setItem(row_idx, 2, QTableWidgetItem(f"{result['Q Water']:.2f}"))
-            self.table.setItem(row_idx, 3, QTableWidgetItem(f"{result['Total Q']:.2f}"))
-            
-            if production_type == "GAS LIFT":
-                self.table.setItem(row_idx, 4, QTableWidgetItem(f"{result['Q Gas']:.2f}"))
-                self.table.setItem(row_idx, 5, QTableWidgetItem(f"{result['Formation Gas']:.2f}"))
-                self.table.setItem(row_idx, 6, QTableWidgetItem(f"{result['GOR1']:.2f}"))
-                self.table.setItem(row_idx, 7, QTableWidgetItem(f"{result['GOR1 Formation']:.1f}"))
-                self.table.setItem(row_idx, 8, QTableWidgetItem(f"{result['GOR2']:.1f}"))
-                self.table.setItem(row_idx, 9, QTableWidgetItem(f"{result['Total GOR Formation']:.1f}"))
-                self.table.setItem(row_idx, 10, QTableWidgetItem(f"{result['Total GOR']:.1f}"))
-            else:
-                self.table.setItem(row_idx, 4, QTableWidgetItem(f"{result['Q Gas']:.2f}"))
-                self.table.setItem(row_idx, 5, QTableWidgetItem(f"{result['GOR1']:.1f}"))
-                self.table.setItem(row_idx, 6, QTableWidgetItem(f"{result['GOR2']:.1f}"))
-                self.table.setItem(row_idx, 7, QTableWidgetItem(f"{result['Total GOR']:.1f}"))
+            result_fields = RESULT_FIELDS_BASE + RESULT_FIELDS_NATURAL_FLOW
+        columns = ["Time"] + [column for column, _, _ in result_fields]
+        # Result key and number format for each column after Time
+        fields = [(key, spec) for _, key, spec in result_fields]
         
-        # Add averages row
+        # One array for all rows, with the averages as the last row
         averages = self.parent.current_project["averages"]
-        row_idx = self.table.rowCount()
-        self.table.insertRow(row_idx)
-        self.table.setItem(row_idx, 0, QTableWidgetItem("AVERAGE"))
+        result_columns = self.parent.results_columns()
+        values = np.column_stack([result_columns[key] for key, _ in fields])
+        values = np.vstack([values, [averages.get(key, 0) for key, _ in fields]])
+        values = np.column_stack([np.zeros(len(values)), values])
+        text = {(row, 0): time for row, time in enumerate(result_columns["Time"])}
+        text[(len(values) - 1, 0)] = "AVERAGE"
         
-        self.table.setItem(row_idx, 1, QTableWidgetItem(f"{averages.get('Q Oil', 0):.2f}"))
-        self.table.setItem(row_idx, 2, QTableWidgetItem(f"{averages.get('Q Water', 0):.2f}"))
-        self.table.setItem(row_idx, 3, QTableWidgetItem(f"{averages.get('Total Q', 0):.2f}"))
-        
-        if production_type == "GAS LIFT":
-            self.table.setItem(row_idx, 4, QTableWidgetItem(f"{averages.get('Q Gas', 0):.2f}"))
-            self.table.setItem(row_idx, 5, QTableWidgetItem(f"{averages.get('Formation Gas', 0):.2f}"))
-            self.table.setItem(row_idx, 6, QTableWidgetItem(f"{averages.get('GOR1', 0):.2f}"))
-            self.table.setItem(row_idx, 7, QTableWidgetItem(f"{averages.get('GOR1 Formation', 0):.1f}"))
-            self.table.setItem(row_idx, 8, QTableWidgetItem(f"{averages.get('GOR2', 0):.1f}"))
-            self.table.setItem(row_idx, 9, QTableWidgetItem(f"{averages.get('Total GOR Formation', 0):.1f}"))
-            self.table.setItem(row_idx, 10, QTableWidgetItem(f"{averages.get('Total GOR', 0):.1f}"))
-        else:
-            self.table.setItem(row_idx, 4, QTableWidgetItem(f"{averages.get('Q Gas', 0):.2f}"))
-            self.table.setItem(row_idx, 5, QTableWidgetItem(f"{averages.get('GOR1', 0):.1f}"))
-            self.table.setItem(row_idx, 6, QTableWidgetItem(f"{averages.get('GOR2', 0):.1f}"))
-            self.table.setItem(row_idx, 7, QTableWidgetItem(f"{averages.get('Total GOR', 0):.1f}"))
+        self.model.reset(columns, 0, text_columns=[0],
+                         formats={col: spec for col, (_, spec) in enumerate(fields, 1)})
+        self.model.set_array(values, text)
         
         # Set hexviolet background for averages row
-        for col in range(self.table.columnCount()):
-            item = self.table.item(row_idx, col)
-            if item:
-                item.setBackground(QColor(67, 32, 136))
+        self.model.set_row_background(len(values) - 1, AVERAGE_ROW_COLOR)
 
 class PlotsPage(QWidget):
+    # Plot type -> (title, y label, [(result key, style, label), ...])
+    PLOT_SPECS = {
+        "Production Rates": ('Production Rates Over Time', 'Rate (BBL/D)', [
+            ("Q Oil", 'b-o', 'Q Oil (BBL/D)'),
+            ("Q Water", 'g--s', 'Q Water (BBL/D)'),
+            ("Total Q", 'r-^', 'Total Q (BBL/D)'),
+        ]),
+        "Gas Rates": ('GAS Rates Over Time', 'Rate (MSCF/D)', [
+            ("Q Gas", 'b-o', 'Q Gas (MSCF/D)'),
+        ]),
+        "GOR Analysis": ('GOR Rates Over Time', 'Rate (SCF/STB)', [
+            ("GOR1", 'b-o', 'GOR1 (SCF/STB)'),
+            ("GOR2", 'g--s', 'GOR2 (SCF/STB)'),
+            ("Total GOR", 'r-^', 'Total GOR (SCF/STB)'),
+        ]),
+    }
+    
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
+        # Plot type -> [canvas, axes, lines, results list the lines show,
+        # background without the animated artists, tick labels]
+        self._plots = {}
         self.setup_ui()
         
     def setup_ui(self):
@@ -1060,7 +2085,7 @@ class PlotsPage(QWidget):
         # Header
         header_layout = QHBoxLayout()
         self.title = QLabel("Test Plots")
-        self.title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        self.title.setStyleSheet(PAGE_TITLE_STYLE)
         
         header_layout.addWidget(self.title)
         header_layout.addStretch()
@@ -1086,7 +2111,7 @@ class PlotsPage(QWidget):
         # Navigation
         nav_layout = QHBoxLayout()
         self.back_btn = GradientButton("Back to Results")
-        self.back_btn.setGradient(QColor("#95a5a6"), QColor("#7f8c8d"))
+        self.back_btn.setGradient(*GRADIENT_GREY)
         self.back_btn.clicked.connect(lambda: self.parent.show_page("RESULTS"))
         
         nav_layout.addWidget(self.back_btn)
@@ -1098,114 +2123,84 @@ class PlotsPage(QWidget):
         self.setLayout(layout)
     
     def update_plot(self):
-        # Clear previous plot
-        for i in reversed(range(self.plot_container.layout().count())):
-            widget = self.plot_container.layout().itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
+        for plot in self._plots.values():
+            plot[0].hide()
         
         # Create new plot
         plot_type = self.plot_type.currentText()
-        if plot_type == "Production Rates":
-            self.create_production_plot()
-        elif plot_type == "Gas Rates":
-            self.create_gas_plot()
-        elif plot_type == "GOR Analysis":
-            self.create_gor_plot()
-        elif plot_type == "Pressure Analysis":
+        if plot_type == "Pressure Analysis":
             self.create_pressure_plot()
-    
-    def create_production_plot(self):
-        results = self.parent.current_project["results"]
-        if not results:
             return
-        
-        # Create figure
-        fig = Figure(figsize=(10, 6))
-        canvas = FigureCanvas(fig)
-        ax = fig.add_subplot(111)
-        
-        # Extract data
-        times = [result["Time"] for result in results]
-        q_oil = [result["Q Oil"] for result in results]
-        q_water = [result["Q Water"] for result in results]
-        total_q = [result["Total Q"] for result in results]
-        
-        # Plot data
-        ax.plot(times, q_oil, 'b-o', label='Q Oil (BBL/D)')
-        ax.plot(times, q_water, 'g--s', label='Q Water (BBL/D)')
-        ax.plot(times, total_q, 'r-^', label='Total Q (BBL/D)')
-        
-        # Format plot
-        ax.set_title('Production Rates Over Time')
-        ax.set_xlabel('Time')
-        ax.set_ylabel('Rate (BBL/D)')
-        ax.legend()
-        ax.grid(True)
-        
-        # Add to layout
-        self.plot_container.layout().addWidget(canvas)
-        canvas.draw()
-    
-    def create_gas_plot(self):
-        results = self.parent.current_project["results"]
-        if not results:
+        columns = self.parent.results_columns()
+        if not columns or plot_type not in self.PLOT_SPECS:
             return
         
-        # Create figure
-        fig = Figure(figsize=(10, 6))
-        canvas = FigureCanvas(fig)
-        ax = fig.add_subplot(111)
-        
-        # Extract data
-        times = [result["Time"] for result in results]
-        q_gas = [result["Q Gas"] for result in results]
-                
-        # Plot data
-        ax.plot(times, q_gas, 'b-o', label='Q Gas (MSCF/D)')
-               
-        # Format plot
-        ax.set_title('GAS Rates Over Time')
-        ax.set_xlabel('Time')
-        ax.set_ylabel('Rate (MSCF/D)')
-        ax.legend()
-        ax.grid(True)
-        
-        # Add to layout
-        self.plot_container.layout().addWidget(canvas)
-        canvas.draw()
-    
-    def create_gor_plot(self):
+        # Each plot type keeps one figure; new results only replace the line data
+        plot = self._plots.get(plot_type) or self.create_plot(plot_type)
+        canvas, ax, lines, shown, background, labels = plot
         results = self.parent.current_project["results"]
-        if not results:
-            return
+        if shown is not results:
+            times = columns["Time"]
+            x = np.arange(len(times))
+            for line, (key, _, _) in zip(lines, self.PLOT_SPECS[plot_type][2]):
+                line.set_data(x, columns[key])
+            limits = (ax.get_xlim(), ax.get_ylim())
+            ax.relim()
+            ax.autoscale_view()
+            if background is not None and labels == times and limits == (ax.get_xlim(), ax.get_ylim()):
+                # Same axes as the last full draw: blit only the data
+                canvas.restore_region(background)
+                self._draw_animated(plot)
+                canvas.blit(canvas.figure.bbox)
+            else:
+                ax.set_xticks(x)
+                ax.set_xticklabels(times)
+                plot[5] = list(times)
+                canvas.draw_idle()
+            plot[3] = results
+        canvas.show()
+    
+    def create_plot(self, plot_type):
+        """Build the figure, axes and empty lines of a plot type"""
+        title, ylabel, series = self.PLOT_SPECS[plot_type]
         
         # Create figure
+        Figure, FigureCanvas = matplotlib_classes()
         fig = Figure(figsize=(10, 6))
         canvas = FigureCanvas(fig)
         ax = fig.add_subplot(111)
         
-        # Extract data
-        times = [result["Time"] for result in results]
-        gor1 = [result["GOR1"] for result in results]
-        gor2 = [result["GOR2"] for result in results]
-        total_gor = [result["Total GOR"] for result in results]
-        
-        # Plot data
-        ax.plot(times, gor1, 'b-o', label='GOR1 (SCF/STB)')
-        ax.plot(times, gor2, 'g--s', label='GOR2 (SCF/STB)')
-        ax.plot(times, total_gor, 'r-^', label='Total GOR (SCF/STB)')
+        # Time labels are set as ticks on 0..n-1 positions
+        lines = [ax.plot([], [], style, label=label)[0] for _, style, label in series]
         
         # Format plot
-        ax.set_title('GOR Rates Over Time')
+        ax.set_title(title)
         ax.set_xlabel('Time')
-        ax.set_ylabel('Rate (SCF/STB)')
+        ax.set_ylabel(ylabel)
         ax.legend()
         ax.grid(True)
         
+        # Lines, and the spines and legend drawn over them, are left out of
+        # full draws so later data changes can be blitted onto the background
+        for artist in [*lines, *ax.spines.values(), ax.get_legend()]:
+            artist.set_animated(True)
+        
         # Add to layout
         self.plot_container.layout().addWidget(canvas)
-        canvas.draw()
+        plot = self._plots[plot_type] = [canvas, ax, lines, None, None, None]
+        canvas.mpl_connect('draw_event', lambda event: self._capture_background(plot))
+        return plot
+    
+    def _capture_background(self, plot):
+        """Keep the freshly drawn background, then add the animated artists"""
+        plot[4] = plot[0].copy_from_bbox(plot[0].figure.bbox)
+        self._draw_animated(plot)
+    
+    def _draw_animated(self, plot):
+        """Draw the lines, spines and legend in their usual z-order"""
+        ax = plot[1]
+        for artist in [*plot[2], *ax.spines.values(), ax.get_legend()]:
+            ax.draw_artist(artist)
     
     def create_pressure_plot(self):
         # Similar implementation for pressure plots
@@ -1215,11 +2210,66 @@ class PlotsPage(QWidget):
 # APPLICATION STARTUP
 # =====================
 class RamWareApp(QMainWindow):
+    # Page name -> (attribute holding the page, page class)
+    PAGES = {
+        "DASHBOARD": ("dashboard_page", DashboardPage),
+        "PARAMETERS": ("parameters_page", ParametersPage),
+        "DATA_ENTRY": ("data_entry_page", DataEntryPage),
+        "RESULTS": ("results_page", ResultsPage),
+        "PLOTS": ("plots_page", PlotsPage),
+    }
+    
+    # (time series, (results, columns) or the exception) from a calculation worker
+    calculations_finished = Signal(object, object)
+    
+    # Group box styling applied on top of each theme's palette
+    DARK_STYLESHEET = """
+        QGroupBox {
+            border: 1px solid #444;
+            border-radius: 5px;
+            margin-top: 1ex;
+            font-weight: bold;
+            color: #ddd;
+        }
+        QGroupBox::title {
+            subcontrol-origin: margin;
+            subcontrol-position: top center;
+            padding: 0 5px;
+            background-color: transparent;
+            color: #ddd;
+        }
+    """
+    LIGHT_STYLESHEET = """
+        QGroupBox {
+            border: 1px solid #ccc;
+            border-radius: 5px;
+            margin-top: 1ex;
+            font-weight: bold;
+        }
+        QGroupBox::title {
+            subcontrol-origin: margin;
+            subcontrol-position: top center;
+            padding: 0 5px;
+            background-color: transparent;
+        }
+    """
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("RamWare - Well Testing Software")
         self.setGeometry(100, 100, 1280, 800)
         
+        # Decode the dashboard logo while the rest of the window is set up;
+        # queued first so it does not wait behind the kernel warmup
+        preload_logo(400)
+        # Compile the calculation kernels off the UI thread so the first
+        # recompute does not stall
+        if NUMBA_AVAILABLE:
+            QThreadPool.globalInstance().start(warmup_kernels)
+        
+        # Results come back from the thread pool through a queued signal
+        self.calculations_finished.connect(self._calculations_finished)
+        
         # Initialize database
         self.db = DatabaseManager()
         
@@ -1232,16 +2282,7 @@ class RamWareApp(QMainWindow):
         }
         
         # Initialize project
-        self.current_project = {
-            'id': None,
-            'name': 'New Test',
-            'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'updated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'parameters': {},
-            'time_series': [],
-            'results': [],
-            'averages': {}
-        }
+        self.current_project = self.new_project()
         
         # Load last project if exists
         if self.settings['last_project']:
@@ -1249,6 +2290,17 @@ class RamWareApp(QMainWindow):
             if project:
                 self.current_project = project
         
+        # Column arrays of the current results, tagged with the list they came from
+        self._result_columns = None
+        
+        # Autosave: edits mark the project dirty and restart a single-shot
+        # timer, so rapid edits are written to the database once
+        self._dirty = False
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.setSingleShot(True)
+        self.autosave_timer.setInterval(AUTOSAVE_DELAY_MS)
+        self.autosave_timer.timeout.connect(self._flush)
+        
         # Setup UI
         self.setup_ui()
         self.setup_menu()
@@ -1259,19 +2311,10 @@ class RamWareApp(QMainWindow):
         # Create stacked widget for pages
         self.stacked_widget = QStackedWidget()
         
-        # Create pages
-        self.dashboard_page = DashboardPage(self)
-        self.parameters_page = ParametersPage(self)
-        self.data_entry_page = DataEntryPage(self)
-        self.results_page = ResultsPage(self)
-        self.plots_page = PlotsPage(self)
-        
-        # Add pages to stack
-        self.stacked_widget.addWidget(self.dashboard_page)
-        self.stacked_widget.addWidget(self.parameters_page)
-        self.stacked_widget.addWidget(self.data_entry_page)
-        self.stacked_widget.addWidget(self.results_page)
-        self.stacked_widget.addWidget(self.plots_page)
+        # Pages are created and added to the stack when first shown
+        self._pages = {}
+        for attribute, _ in self.PAGES.values():
+            setattr(self, attribute, None)
         
         # Set central widget
         self.setCentralWidget(self.stacked_widget)
@@ -1365,8 +2408,10 @@ class RamWareApp(QMainWindow):
         else:
             self.apply_light_theme()
     
-    def apply_dark_theme(self):
-        """Apply dark theme to the application"""
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def dark_palette():
+        """Return the dark theme palette, built once on first use"""
         dark_palette = QPalette()
         
         # Base colors
@@ -1387,26 +2432,12 @@ class RamWareApp(QMainWindow):
         dark_palette.setColor(QPalette.Disabled, QPalette.Text, Qt.darkGray)
         dark_palette.setColor(QPalette.Disabled, QPalette.ButtonText, Qt.darkGray)
         
-        self.setPalette(dark_palette)
-        self.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #444;
-                border-radius: 5px;
-                margin-top: 1ex;
-                font-weight: bold;
-                color: #ddd;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 5px;
-                background-color: transparent;
-                color: #ddd;
-            }
-        """)
+        return dark_palette
     
-    def apply_light_theme(self):
-        """Apply light theme to the application"""
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def light_palette():
+        """Return the light theme palette, built once on first use"""
         light_palette = QPalette()
         
         # Base colors
@@ -1423,72 +2454,89 @@ class RamWareApp(QMainWindow):
         light_palette.setColor(QPalette.Highlight, QColor(66, 134, 244))
         light_palette.setColor(QPalette.HighlightedText, Qt.white)
         
-        self.setPalette(light_palette)
-        self.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #ccc;
-                border-radius: 5px;
-                margin-top: 1ex;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 5px;
-                background-color: transparent;
-            }
-        """)
+        return light_palette
+    
+    def apply_dark_theme(self):
+        """Apply dark theme to the application"""
+        self.setPalette(self.dark_palette())
+        self.setStyleSheet(self.DARK_STYLESHEET)
+    
+    def apply_light_theme(self):
+        """Apply light theme to the application"""
+        self.setPalette(self.light_palette())
+        self.setStyleSheet(self.LIGHT_STYLESHEET)
     
     def show_page(self, page_name):
-        page_map = {
-            "DASHBOARD": 0,
-            "PARAMETERS": 1,
-            "DATA_ENTRY": 2,
-            "RESULTS": 3,
-            "PLOTS": 4
-        }
+        # Pages are created the first time they are shown
+        page = self._pages.get(page_name)
+        if page is None:
+            attribute, page_class = self.PAGES[page_name]
+            page = self._pages[page_name] = page_class(self)
+            setattr(self, attribute, page)
+            self.stacked_widget.addWidget(page)
         
-        self.stacked_widget.setCurrentIndex(page_map[page_name])
+        self.stacked_widget.setCurrentWidget(page)
         
         # Page-specific setup
         if page_name == "DASHBOARD":
-            self.dashboard_page.load_recent_projects()
+            page.load_recent_projects()
         elif page_name == "DATA_ENTRY":
-            self.data_entry_page.setup_table()
+            page.setup_table()
         elif page_name == "RESULTS":
-            self.results_page.display_results()
+            page.display_results()
         elif page_name == "PLOTS":
-            self.plots_page.update_plot()
+            page.update_plot()
     
-    def create_new_test(self):
-        self.current_project = {
+    @staticmethod
+    def new_project():
+        """Return an empty, unsaved project"""
+        now = datetime.now().isoformat(sep=' ', timespec='seconds')  # YYYY-MM-DD HH:MM:SS
+        return {
             'id': None,
             'name': 'New Test',
-            'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'updated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'created_at': now,
+            'updated_at': now,
             'parameters': {},
-            'time_series': [],
+            'time_series': {},
             'results': [],
             'averages': {}
         }
+    
+    def create_new_test(self):
+        self.current_project = self.new_project()
         self.show_page("PARAMETERS")
     
     def open_project_dialog(self):
-        projects = self.db.list_projects()
-        if not projects:
-            QMessageBox.information(self, "No Projects", "No saved projects found.")
-            return
-        
-        # Create dialog to select project
-        # (In a full implementation, this would be a proper dialog with project list)
-        project_id, ok = QInputDialog.getItem(
-            self, "Open Project", "Select a project:",
-            [f"{p[1]} ({p[3][:10]})" for p in projects], 0, False
-        )
+        page_size = 100
+        more = "More…"
+        projects = []
+        labels = []
+        label_ids = {}  # Label -> project id; the first project wins for duplicate labels
+        while True:
+            # Fetch the next page of projects
+            page = self.db.list_projects(limit=page_size, offset=len(projects))
+            projects.extend(page)
+            for p in page:
+                label = f"{p[1]} ({p[3][:10]})"
+                labels.append(label)
+                label_ids.setdefault(label, p[0])
+            if not projects:
+                QMessageBox.information(self, "No Projects", "No saved projects found.")
+                return
+            has_more = len(page) == page_size
+            
+            # Create dialog to select project
+            # (In a full implementation, this would be a proper dialog with project list)
+            project_id, ok = QInputDialog.getItem(
+                self, "Open Project", "Select a project:",
+                labels + [more] if has_more else labels,
+                len(projects) - len(page), False
+            )
+            if not (ok and has_more and project_id == more):
+                break
         
         if ok and project_id:
-            index = [f"{p[1]} ({p[3][:10]})" for p in projects].index(project_id)
-            self.load_project(projects[index][0])
+            self.load_project(label_ids[project_id])
     
     def load_project(self, project_id):
         project = self.db.load_project(project_id)
@@ -1502,16 +2550,32 @@ class RamWareApp(QMainWindow):
             else:
                 self.show_page("PARAMETERS")
     
+    def mark_dirty(self):
+        """Schedule an autosave of the current project"""
+        self._dirty = True
+        self.autosave_timer.start()
+    
+    def _flush(self):
+        """Write pending edits of an already saved project"""
+        self.autosave_timer.stop()
+        # New projects are only written once the user names them
+        if not self._dirty or not self.current_project.get('id'):
+            return
+        if self.db.save_project(self.current_project):
+            self._dirty = False
+            self.statusBar().showMessage(f"Project autosaved: {self.current_project['name']}")
+    
     def save_project(self):
         if not self.current_project.get('name'):
             self.save_project_as()
             return
         
-        project = self.db.save_project(self.current_project)
+        # The project and last_project setting share one commit
+        project = self.db.save_project(self.current_project, self.settings)
         if project:
+            self._dirty = False
+            self.autosave_timer.stop()
             self.current_project = project
-            self.settings['last_project'] = project['id']
-            self.db.save_settings(self.settings)
             self.statusBar().showMessage(f"Project saved: {project['name']}")
             return True
         return False
@@ -1528,120 +2592,67 @@ class RamWareApp(QMainWindow):
         return False
     
     def perform_calculations(self):
-        """Perform all calculations for the current project"""
-        params = self.current_project["parameters"]
+        """Calculate the current project's results on the thread pool
+        
+        _calculations_finished stores the results and shows them once the
+        worker is done, so long time series do not block the UI.
+        """
+        params = dict(self.current_project["parameters"])
         time_series = self.current_project["time_series"]
-        results = []
+        self.statusBar().showMessage("Calculating...")
         
-        # Initialize values
-        prev_meter_oil = 0.0
-        prev_meter_water = 0.0
-        prev_meter_liquid = 0.0
+        def run():
+            try:
+                outcome = WellTestCalculator.calculate_time_series(params, time_series)
+            except Exception as e:
+                outcome = e
+            # Queued to the UI thread, since the window lives there
+            self.calculations_finished.emit(time_series, outcome)
         
-        # Process each time entry
-        for i, entry in enumerate(time_series):
-            result = {"Time": entry["Time"]}
-            
-            # Calculate volume differences
-            if params["separation_type"] == "THREE PHASES":
-                meter_oil = entry.get("Meter Oil (BBL)", 0)
-                meter_water = entry.get("Meter Water (BBL)", 0)
-                vs_oil = meter_oil - prev_meter_oil
-                vs_water = meter_water - prev_meter_water
-                wio = entry.get("WIO (%)", 0) / 100.0
-                prev_meter_oil = meter_oil
-                prev_meter_water = meter_water
-            else:
-                meter_liquid = entry.get("Meter Liquid (BBL)", 0)
-                vs_liquid = meter_liquid - prev_meter_liquid
-                bsw = entry.get("BSW (%)", 0) / 100.0
-                prev_meter_liquid = meter_liquid
-            
-            # Calculate VCF and oil api 60f
-            sep_temp = entry.get("Oil T (°C)", 0)  # Using oil temp as separator temp
-            
-            oil_api_60f = WellTestCalculator.calculate_oil_api_60f(
-                params["oil_temp"], params["oil_api"]
-            )
-            
-            vcf_sep = WellTestCalculator.calculate_vcf_sep(
-                sep_temp, oil_api_60f
-            )
-            
-            # Calculate GOR2 and shrinkage factor
-            sep_p = entry.get("SEP P (PSIG)", 0)
-            gor2 = WellTestCalculator.calculate_gor2(
-                oil_api_60f, params["sg_gas"], 
-                sep_p, sep_temp, params["gor2_method"]
-            )
-            
-            sf = WellTestCalculator.calculate_shrinkage_factor(
-                gor2, sep_p, oil_api_60f
-            )
-            
-            # Calculate flow rates
-            if params["separation_type"] == "THREE PHASES":
-                q_oil, q_water = WellTestCalculator.calculate_three_phase_flow(
-                    vs_oil, vs_water, wio, 
-                    params["meter_factor"], sf, vcf_sep
-                )
-            else:
-                q_oil, q_water = WellTestCalculator.calculate_two_phase_flow(
-                    vs_liquid, bsw, 
-                    params["meter_factor"], sf, vcf_sep
-                )
-            
-            result["Q Oil"] = q_oil
-            result["Q Water"] = q_water
-            result["Total Q"] = q_oil + q_water
-            
-            # Calculate gas flow
-            gas_t = entry.get("GAS T (°C)", 0)
-            q_gas = WellTestCalculator.calculate_gas_flow(
-                entry["GAS DP (inH₂O)"], sep_p, 
-                gas_t, params["sg_gas"], 
-                params["orifice_diameter"], params["line_bore"], 
-                params["h2s"], params["co2"]
-            )
-            
-            result["Q Gas"] = q_gas
-            
-            # Calculate GORs
-            result["GOR1"] = (q_gas * 1000) / q_oil if q_oil > 0 else 0
-            result["GOR2"] = gor2
-            result["Total GOR"] = result["GOR1"] + gor2
-            
-            # Gas Lift specific calculations
-            if params["production_type"] == "GAS LIFT":
-                q_gas_inj = entry.get("Q Gas Inj (MSCF/D)", 0)
-                result["Q Gas Inj"] = q_gas_inj
-                
-                formation_gas, gor1_formation, total_gor_formation = WellTestCalculator.calculate_for_gas_lift(
-                    q_gas, q_gas_inj, q_oil, gor2
-                )
-                
-                result["Formation Gas"] = formation_gas
-                result["GOR1 Formation"] = gor1_formation
-                result["Total GOR Formation"] = total_gor_formation
-            
-            results.append(result)
+        QThreadPool.globalInstance().start(run)
+    
+    def _calculations_finished(self, time_series, outcome):
+        """Store the results of a finished calculation and show them"""
+        # Data entered again, or another project opened, since it started
+        if time_series is not self.current_project["time_series"]:
+            return
+        if isinstance(outcome, Exception):
+            self.statusBar().clearMessage()
+            QMessageBox.critical(self, "Calculation Error", f"Failed to calculate results: {str(outcome)}")
+            return
         
+        results, columns = outcome
         self.current_project["results"] = results
+        self._result_columns = (results, columns) if results else None
         self.calculate_averages()
+        self.statusBar().clearMessage()
+        self.mark_dirty()
+        self.show_page("RESULTS")
     
-    def calculate_averages(self):
-        """Calculate average values for all results"""
+    def results_columns(self):
+        """Result columns as arrays ("Time" as a list), built once per results list"""
         results = self.current_project["results"]
         if not results:
+            return None
+        if self._result_columns is None or self._result_columns[0] is not results:
+            # Results loaded from the database rather than just calculated
+            columns = {key: [r[key] for r in results] for key in results[0]}
+            for key in columns:
+                if key != "Time":
+                    columns[key] = np.asarray(columns[key], dtype=np.float64)
+            self._result_columns = (results, columns)
+        return self._result_columns[1]
+    
+    def calculate_averages(self):
+        """Calculate average values for all results"""
+        columns = self.results_columns()
+        if not columns:
             return
         
-        averages = {}
-        for key in results[0].keys():
-            if key != "Time":
-                values = [r[key] for r in results]
-                averages[key] = sum(values) / len(values)
-        
-        self.current_project["averages"] = averages
+        # One NumPy reduction per result column
+        self.current_project["averages"] = {
+            key: float(values.mean()) for key, values in columns.items() if key != "Time"
+        }
     
     def export_report(self):
         """Export the current report to PDF"""
@@ -1659,19 +2670,14 @@ class RamWareApp(QMainWindow):
     
     def generate_pdf_report(self, file_path):
         """Generate PDF report using ReportLab"""
+        # ReportLab is only needed for exports, so it is imported on first use
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer
+        styles, title_style, well_table_style, summary_table_style = pdf_styles()
+        
         # Create PDF document
         doc = SimpleDocTemplate(file_path, pagesize=letter)
         elements = []
-        styles = getSampleStyleSheet()
-        
-        # Title style
-        title_style = ParagraphStyle(
-            'Title',
-            parent=styles['Title'],
-            fontSize=18,
-            spaceAfter=12,
-            alignment=1  # Center aligned
-        )
         
         # Add title
         title = Paragraph("RamWare - Well Test Report", title_style)
@@ -1684,52 +2690,21 @@ class RamWareApp(QMainWindow):
             ["Test Date:", self.current_project["parameters"].get("test_date", "")]
         ]
         well_table = Table(well_info, colWidths=[100, 300])
-        well_table.setStyle(TableStyle([
-            ('FONT', (0, 0), (-1, -1), 'Helvetica', 10),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        well_table.setStyle(well_table_style)
         elements.append(well_table)
         elements.append(Spacer(1, 12))
         
         # Add summary table
-        summary_data = [["Parameter", "Value", "Units"]]
         averages = self.current_project["averages"]
-        
-        # Add key metrics
-        summary_data.append(["Q Oil", f"{averages.get('Q Oil', 0):.2f}", "BBL/D"])
-        summary_data.append(["Q Water", f"{averages.get('Q Water', 0):.2f}", "BBL/D"])
-        summary_data.append(["Total Liquid", f"{averages.get('Total Q', 0):.2f}", "BBL/D"])
-        summary_data.append(["Q Gas", f"{averages.get('Q Gas', 0):.2f}", "MSCF/D"])
-        summary_data.append(["GOR1", f"{averages.get('GOR1', 0):.2f}", "SCF/STB"])
-        summary_data.append(["Total GOR", f"{averages.get('Total GOR', 0):.2f}", "SCF/STB"])
-        
-        if self.current_project["parameters"]["production_type"] == "GAS LIFT":
-            summary_data.append(["Q Gas Inj", f"{averages.get('Q Gas Inj', 0):.2f}", "MSCF/D"])
-            summary_data.append(["Formation Gas", f"{averages.get('Formation Gas', 0):.2f}", "MSCF/D"])
-            summary_data.append(["GOR1 Formation", f"{averages.get('GOR1 Formation', 0):.1f}", "SCF/STB"])
-        
-        summary_data.append(["GOR2", f"{averages.get('GOR2', 0):.1f}", "SCF/STB"])
-        
         if self.current_project["parameters"]["production_type"] == "GAS LIFT":
-            summary_data.append(["Total GOR Formation", f"{averages.get('Total GOR Formation', 0):.1f}", "SCF/STB"])
+            rows = PDF_SUMMARY_BASE + PDF_SUMMARY_GAS_LIFT
         else:
-            summary_data.append(["Total GOR", f"{averages.get('Total GOR', 0):.1f}", "SCF/STB"])
+            rows = PDF_SUMMARY_BASE + PDF_SUMMARY_NATURAL_FLOW
+        summary_data = [["Parameter", "Value", "Units"]]
+        summary_data += [[label, format(averages.get(key, 0), fmt), unit] for label, key, fmt, unit in rows]
         
         summary_table = Table(summary_data, colWidths=[150, 100, 80])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#2c3e50")),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONT', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor("#f8f8f8")),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        summary_table.setStyle(summary_table_style)
         elements.append(summary_table)
         elements.append(Spacer(1, 24))
         
@@ -1775,7 +2750,8 @@ class RamWareApp(QMainWindow):
         QMessageBox.about(self, f"About {APP_NAME}", about_text)
     
     def closeEvent(self, event):
-        # ... (rest of the method code remains unchanged)
+        # Write any edits still waiting for the autosave timer
+        self._flush()
         event.accept()
 
 # =====================
@@ -1792,99 +2768,3 @@ if __name__ == "__main__":
     
     # Run application
     sys.exit(app.exec())
-def setup_ui(self):
-    # Main layout
-    main_layout = QVBoxLayout()
-    main_layout.setContentsMargins(50, 30, 50, 30)
-    main_layout.setSpacing(30)
-    
-    # Header (Logo only, no text title)
-    header_layout = QHBoxLayout()
-    logo = QLabel()
-    pixmap = QPixmap(":/icons/logo.png")
-    if pixmap.isNull():
-        pixmap = QPixmap("logo.png")  # fallback if resource path fails
-    pixmap = pixmap.scaledToHeight(120, Qt.SmoothTransformation)
-    logo.setPixmap(pixmap)
-    logo.setAlignment(Qt.AlignCenter)
-    header_layout.addWidget(logo, alignment=Qt.AlignCenter)
-    
-    # Remove the old title QLabel line:
-    # title = QLabel("RamWare - Well Testing Software")
-    # title.setStyleSheet("font-size: 38px; font-weight: bold; color: #ffffff;")
-    # header_layout.addWidget(title, alignment=Qt.AlignCenter)
-    
-    # Buttons
-    button_layout = QVBoxLayout()
-    button_layout.setSpacing(20)
-    button_layout.setContentsMargins(100, 0, 100, 0)
-    
-    self.new_test_btn = GradientButton("Create New Test")
-    self.new_test_btn.setGradient(QColor("#2ecc71"), QColor("#27ae60"))
-    self.new_test_btn.clicked.connect(self.parent.create_new_test)
-    
-    self.open_test_btn = GradientButton("Open Existing Test")
-    self.open_test_btn.setGradient(QColor("#3498db"), QColor("#2980b9"))
-    self.open_test_btn.clicked.connect(self.parent.open_project_dialog)
-    
-    self.tutorials_btn = GradientButton("Tutorials")
-    self.tutorials_btn.setGradient(QColor("#9b59b6"), QColor("#8e44ad"))
-    self.tutorials_btn.clicked.connect(self.parent.show_tutorials)
-    
-    button_layout.addWidget(self.new_test_btn)
-    button_layout.addWidget(self.open_test_btn)
-    button_layout.addWidget(self.tutorials_btn)
-    
-    # Recent projects
-    recent_group = QGroupBox("Recent Projects")
-    recent_layout = QVBoxLayout()
-    
-    self.recent_list = QComboBox()
-    self.recent_list.setMinimumHeight(35)
-    recent_layout.addWidget(self.recent_list)
-    
-    open_recent_btn = GradientButton("Open Selected Project")
-    open_recent_btn.setGradient(QColor("#f39c12"), QColor("#d35400"))
-    open_recent_btn.clicked.connect(self.open_recent_project)
-    recent_layout.addWidget(open_recent_btn)
-    
-    recent_group.setLayout(recent_layout)
-    
-    # Footer
-    footer = QLabel(f"© {datetime.now().year} {COMPANY} | Version {VERSION}")
-    footer.setStyleSheet("color: #7f8c8d; font-size: 12px;")
-    footer.setAlignment(Qt.AlignCenter)
-    
-    # Add to main layout
-    main_layout.addLayout(header_layout)
-    main_layout.addStretch(1)
-    main_layout.addLayout(button_layout)
-    main_layout.addStretch(1)
-    main_layout.addWidget(recent_group)
-    main_layout.addStretch(1)
-    main_layout.addWidget(footer)
-    
-    self.setLayout(main_layout)
-def setup_ui(self):
-    # Main layout
-    main_layout = QVBoxLayout()
-    main_layout.setContentsMargins(50, 30, 50, 30)
-    main_layout.setSpacing(30)
-    
-    # Header (Logo only, no text title)
-    header_layout = QHBoxLayout()
-    logo = QLabel()
-    pixmap = QPixmap(":/icons/logo.png")
-    if pixmap.isNull():
-        pixmap = QPixmap("logo.png")  # fallback if resource path fails
-    pixmap = pixmap.scaledToHeight(120, Qt.SmoothTransformation)
-    logo.setPixmap(pixmap)
-    logo.setAlignment(Qt.AlignCenter)
-    header_layout.addWidget(logo, alignment=Qt.AlignCenter)
-    
-    # Remove the old title QLabel line:
-    # title = QLabel("RamWare - Well Testing Software")
-    # title.setStyleSheet("font-size: 38px; font-weight: bold; color: #ffffff;")
-    # header_layout.addWidget(title, alignment=Qt.AlignCenter)
-    
-    # ... rest of your setup_ui code ...